@@ -1,7 +1,11 @@
 import random
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
+
+from error_report import ErrorCollector
+from poolgen import PoolStream
 
 # Create a FastAPI instance
 app = FastAPI()
@@ -30,3 +34,21 @@ async def get_random_users():
     random_users = random.sample(users, 3)  # Select 3 random users
     return random_users
 
+# /pools route - POST a tab-separated "fqdn<TAB>port" inventory, get back the
+# {"POOLS": ...} document. The body is validated block by block as it arrives
+# and the document is streamed out as rows are built, so neither side is ever
+# held whole; every request shares poolgen's cached constants. The body is
+# exactly the pools document; POST /pools?errors=1 adds a summary of the
+# validation issues under "ERRORS" at the end of it.
+@app.post("/pools")
+async def generate_pools(request: Request, errors: bool = False):
+    stream = PoolStream(errors=ErrorCollector(), error_summary=errors)
+
+    async def document():
+        async for data in request.stream():
+            piece = await run_in_threadpool(stream.feed, data)
+            if piece:
+                yield piece
+        yield await run_in_threadpool(stream.finish)
+
+    return StreamingResponse(document(), media_type="application/json")
@@ -0,0 +1,75 @@
+# 🏁 Serial encode_chunk loop vs. the chunked process-pool engine
+#
+# Usage: python benchmarks/bench_pool_engine.py [entries ...] [--workers N] [--chunk-size N]
+# Both sides produce encoded entry fragments, which is the work a generator
+# run actually has to do before writing, and both run encode_chunk over the
+# same --chunk-size chunks (the compiled entry template when the constants
+# allow it), so the speedup column measures the process pool alone.
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pool_engine import DEFAULT_CHUNK_SIZE, encode_chunk, generate_chunks, iter_chunks, make_constants  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 50_000, 200_000, 500_000]
+
+constants = make_constants(
+    ["100.116.121.0/24", "100.124.121.0/24"],
+    [
+        {"regex": "100[.]116[.]123[.]240", "replace": "epm.glb.cala.attmx.avayacloud.com"},
+        {"regex": "100[.]124[.]123[.]240", "replace": "epmgeo.glb.cala.attmx.avayacloud.com"},
+    ],
+    [{"header": "TerminationURL", "regex": "http", "replace": "https"}],
+    "CONSTANTS:my_whitelist",
+)
+
+
+def synthetic_hosts(n):
+    return [(f"benchvxmldsmty{i:07d}", "glb.avayacloud.com", str(10000 + i % 50000)) for i in range(n)]
+
+
+def run_serial(host_port_list, chunk_size):
+    count = 0
+    for chunk in iter_chunks(host_port_list, chunk_size):
+        count += len(encode_chunk(chunk, constants))
+    return count
+
+
+def run_parallel(host_port_list, workers, chunk_size):
+    count = 0
+    for fragments in generate_chunks(host_port_list, constants, workers=workers,
+                                     chunk_size=chunk_size, encoded=True):
+        count += len(fragments)
+    return count
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs. process-pool pool generation")
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    print(f"workers={args.workers} chunk_size={args.chunk_size}")
+    print(f"{'entries':>10} {'serial s':>10} {'process s':>10} {'speedup':>8}  winner")
+    for n in args.sizes:
+        host_port_list = synthetic_hosts(n)
+        serial_s, serial_count = timed(run_serial, host_port_list, args.chunk_size)
+        parallel_s, parallel_count = timed(run_parallel, host_port_list, args.workers, args.chunk_size)
+        assert serial_count == parallel_count == 2 * n
+        speedup = serial_s / parallel_s
+        winner = "process" if speedup > 1 else "serial"
+        print(f"{n:>10,} {serial_s:>10.3f} {parallel_s:>10.3f} {speedup:>7.2f}x  {winner}")
+
+
+if __name__ == "__main__":
+    main()
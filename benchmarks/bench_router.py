@@ -0,0 +1,94 @@
+# 🏁 PoolRouter lookups vs. a linear first-match regex scan
+#
+# Usage: python benchmarks/bench_router.py [--rows 60000] [--lookups 200000] [--linear-lookups 200]
+# Builds 2 pools per synthetic row (100k+ pools by default), plus a few
+# hand-written regexUrl pools, routes the same mix of hit and miss URLs with
+# both engines, checks that they agree, and prints lookups per second.
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_pool_engine import constants, synthetic_hosts  # noqa: E402
+from pool_engine import build_chunk  # noqa: E402
+from pool_router import PoolRouter  # noqa: E402
+
+HAND_WRITTEN = [
+    ("CUSTOM_LEGACY_API", r"^https://legacy[.]glb[.]avayacloud[.]com:443/api/"),
+    ("CUSTOM_ANY_EPM", r"^https?://epm[0-9]*[.]glb[.]cala[.]attmx[.]avayacloud[.]com:443/"),
+]
+
+
+def build_pools(rows):
+    pools = {key: {"regexUrl": pattern} for key, pattern in HAND_WRITTEN[:1]}
+    pools.update(build_chunk(synthetic_hosts(rows), constants))
+    pools.update({key: {"regexUrl": pattern} for key, pattern in HAND_WRITTEN[1:]})
+    return pools
+
+
+def sample_urls(pools, n, seed):
+    rng = random.Random(seed)
+    hosts = [pattern[pattern.index("(") + 1:pattern.index(")")].replace("[.]", ".")
+             for pattern in (config["regexUrl"] for config in pools.values()) if "(" in pattern]
+    urls = []
+    for _ in range(n):
+        roll = rng.random()
+        if roll < 0.8:
+            urls.append(f"{rng.choice(('https', 'http'))}://{rng.choice(hosts)}:443/path?q=1")
+        elif roll < 0.9:
+            urls.append("https://legacy.glb.avayacloud.com:443/api/v1")
+        else:
+            urls.append(f"https://unknown{rng.randint(0, 10**6)}.glb.ac.com:443/")
+    return urls
+
+
+def linear_route(compiled, url):
+    for pool_key, regex in compiled:
+        if regex.match(url):
+            return pool_key
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hash-indexed router vs. linear regex scan")
+    parser.add_argument("--rows", type=int, default=60_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--linear-lookups", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pools = build_pools(args.rows)
+    start = time.perf_counter_ns()
+    router = PoolRouter(pools.items())
+    router_build_ns = time.perf_counter_ns() - start
+    start = time.perf_counter_ns()
+    compiled = [(key, re.compile(config["regexUrl"])) for key, config in pools.items()]
+    linear_build_ns = time.perf_counter_ns() - start
+
+    urls = sample_urls(pools, args.lookups, args.seed)
+    start = time.perf_counter_ns()
+    routed = list(map(router.route, urls))
+    router_ns = time.perf_counter_ns() - start
+
+    checked = urls[:args.linear_lookups]
+    start = time.perf_counter_ns()
+    expected = [linear_route(compiled, url) for url in checked]
+    linear_ns = time.perf_counter_ns() - start
+    if routed[:len(checked)] != expected:
+        sys.exit("❌ PoolRouter disagrees with the linear regex scan")
+
+    print(f"{len(pools):,} pools ({router.stats.literal:,} literal, {router.stats.opaque:,} hand-written)")
+    print(f"{'router':<8} build {router_build_ns / 1e6:>9.1f} ms  "
+          f"{len(urls) / (router_ns / 1e9):>14,.0f} lookups/s ({len(urls):,} lookups)")
+    print(f"{'linear':<8} build {linear_build_ns / 1e6:>9.1f} ms  "
+          f"{len(checked) / (linear_ns / 1e9):>14,.0f} lookups/s ({len(checked):,} lookups)")
+    print(f"speedup  {(linear_ns / len(checked)) / (router_ns / len(urls)):>14,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+# 🏁 Stage-by-stage benchmark of the pool generator variants
+#
+# Usage:
+#   python benchmarks/bench_stages.py [--sizes 1000 10000 ...] [--variants ...] [--output results.json]
+#   python benchmarks/bench_stages.py --compare base.json new.json
+#
+# For each inventory size a synthetic fqdn_input.txt is generated (duplicates,
+# invalid FQDNs, bad ports), then every variant runs in a fresh child process
+# so peak RSS is per run. Load, pre-validation, build, serialization and
+# post-validation are timed separately. Results are written as JSON tagged
+# with the current git commit so runs can be compared across commits.
+#
+# jq4's pre-validation is what jq4.py runs: poolgen.validate_file(), i.e.
+# validator.validate_file_parallel (or the bloom prefilter for jq4-bloom),
+# which reads the file itself, so its load stage is empty; jq4-perline times
+# the per-line jq4.pre_validate fallback. jq1-3, j.py and jg.py cannot read
+# an inventory file, so they run once on their embedded host lists as whole
+# scripts (timed as build, which includes their serialization) and are
+# reported at that size.
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+STAGES = ["load", "pre_validation", "build", "serialization", "post_validation"]
+OUTPUT_JSON = "pools_output.json"
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# 🧩 Variants: each returns {stage: callable} run in STAGES order, sharing state
+def _jq4_variant(mode):
+    def stages(path):
+        import bloom_dedup  # noqa: F401  (poolgen imports it on first use; keep that out of the timings)
+        import jq4
+        import validator  # noqa: F401
+        from inventory import iter_inventory
+        from pool_engine import calibrate, hoist_constants, run_plan
+        from pool_writer import PoolJsonWriter
+        from poolgen import validate_file
+
+        state = {}
+        shared_section, pool_constants = None, jq4.constants
+        if mode == "shared":
+            shared_section, pool_constants = hoist_constants(jq4.constants)
+
+        def load():
+            if mode == "perline":
+                state["records"] = list(iter_inventory(path))
+
+        def pre_validation():
+            if mode == "perline":
+                state["rows"], state["errors"] = jq4.pre_validate(state.pop("records"))
+            else:
+                state["rows"], state["errors"] = validate_file(path, workers=jq4.VALIDATION_WORKERS,
+                                                               bloom=mode == "bloom",
+                                                               mmap_threshold=jq4.MMAP_THRESHOLD)
+
+        def build():
+            if mode == "dump":
+                pools = {}
+                for row in state["rows"]:
+                    pools.update(jq4.build_pools(*row))
+                state["pools"] = pools
+            else:
+                plan = calibrate(state["rows"], pool_constants)
+                state["fragments"] = [f for chunk in run_plan(plan, state["rows"], pool_constants) for f in chunk]
+
+        def serialization():
+            if mode == "dump":
+                with open(OUTPUT_JSON, "w") as f:
+                    json.dump({"POOLS": state.pop("pools")}, f, indent=2)
+            else:
+                with PoolJsonWriter(OUTPUT_JSON, constants=shared_section) as writer:
+                    for fragment in state.pop("fragments"):
+                        writer.write_encoded(fragment)
+
+        return state, {"load": load, "pre_validation": pre_validation, "build": build,
+                       "serialization": serialization}
+    return stages
+
+
+def _script_variant(script, rows_name):
+    # A whole legacy script on its embedded input; `rows_name` is its list of
+    # rows, for the size it is reported at
+    def stages(path):
+        import runpy
+
+        state = {"errors": []}
+
+        def build():
+            namespace = runpy.run_path(os.path.join(ROOT, script), run_name="__main__")
+            state["rows"] = namespace[rows_name]
+
+        noop = lambda: None  # noqa: E731
+        return state, {"load": noop, "pre_validation": noop, "build": build, "serialization": noop}
+    return stages
+
+
+def _jq5_variant(path):
+    import jq5notworking as jq5
+    from pool_engine import generate_chunks, make_constants
+    from pool_writer import PoolJsonWriter
+
+    state = {}
+    constants = make_constants(jq5.local_subnets, jq5.url_rewrites, jq5.header_updates, jq5.whitelist)
+
+    def load():
+        with open(path, "r") as f:
+            state["raw"] = f.read()
+
+    def pre_validation():
+        state["rows"], state["errors"] = jq5.pre_validate(state.pop("raw"))
+
+    def build():
+        chunks = generate_chunks(state["rows"], constants, chunk_size=jq5.CHUNK_SIZE, encoded=True)
+        state["fragments"] = [f for chunk in chunks for f in chunk]
+
+    def serialization():
+        with PoolJsonWriter(OUTPUT_JSON) as writer:
+            for fragment in state.pop("fragments"):
+                writer.write_encoded(fragment)
+
+    return state, {"load": load, "pre_validation": pre_validation, "build": build,
+                   "serialization": serialization}
+
+
+VARIANTS = {
+    "jq4-dump": _jq4_variant("dump"),
+    "jq4-stream": _jq4_variant("stream"),
+    "jq4-shared": _jq4_variant("shared"),
+    "jq4-bloom": _jq4_variant("bloom"),
+    "jq4-perline": _jq4_variant("perline"),
+    "jq5-process": _jq5_variant,
+    "jq1": _script_variant("jq1.py", "hostnames"),
+    "jq2": _script_variant("jq2.py", "hostnames"),
+    "jq3": _script_variant("jq3.py", "unique_host_port_list"),
+    "j": _script_variant("j.py", "hostnames"),
+    "jg": _script_variant("jg.py", "hostnames"),
+}
+SCRIPT_VARIANTS = {"jq1", "jq2", "jq3", "j", "jg"}  # fixed embedded input, run once
+
+
+def post_validation():
+    from pool_verify import verify_output
+    return verify_output(OUTPUT_JSON).entries
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_child(variant, path):
+    state, stages = VARIANTS[variant](path)
+    stages["post_validation"] = lambda: state.__setitem__("entries", post_validation())
+    timings = {}
+    for stage in STAGES:
+        start = time.perf_counter_ns()
+        stages[stage]()
+        timings[stage] = time.perf_counter_ns() - start
+    return {
+        "stages_ns": timings,
+        "valid_rows": len(state["rows"]),
+        "errors": len(state["errors"]),
+        "entries": state["entries"],
+        "output_bytes": os.path.getsize(OUTPUT_JSON),
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+# 📊 Parent side
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_case(variant, lines, workdir):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", variant, "fqdn_input.txt"],
+        cwd=workdir, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    if variant in SCRIPT_VARIANTS:
+        lines = result["valid_rows"]
+    total_ns = sum(result["stages_ns"].values())
+    result.update({
+        "variant": variant,
+        "lines": lines,
+        "total_ns": total_ns,
+        "lines_per_s": lines / (total_ns / 1e9) if total_ns else None,
+        "stage_lines_per_s": {stage: lines / (ns / 1e9) if ns else None
+                              for stage, ns in result["stages_ns"].items()},
+    })
+    return result
+
+
+def print_result(r):
+    stages = " ".join(f"{r['stages_ns'][s] / 1e6:>10.1f}" for s in STAGES)
+    rss = f"{r['peak_rss_kb'] / 1024:>8.1f}" if r["peak_rss_kb"] is not None else f"{'n/a':>8}"
+    print(f"{r['variant']:<12} {r['lines']:>11,} {stages} {r['total_ns'] / 1e6:>10.1f} "
+          f"{r['lines_per_s']:>12,.0f} {rss}")
+
+
+def compare(base_path, new_path):
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    base_index = {(r["variant"], r["lines"]): r for r in base["results"]}
+    print(f"{base.get('commit')} -> {new.get('commit')}")
+    print(f"{'variant':<12} {'lines':>11} {'base ms':>10} {'new ms':>10} {'speedup':>8} {'rss MB':>15}")
+    for r in new["results"]:
+        b = base_index.get((r["variant"], r["lines"]))
+        if not b:
+            continue
+        rss = "n/a"
+        if b["peak_rss_kb"] is not None and r["peak_rss_kb"] is not None:
+            rss = f"{b['peak_rss_kb'] / 1024:.1f}->{r['peak_rss_kb'] / 1024:.1f}"
+        print(f"{r['variant']:<12} {r['lines']:>11,} {b['total_ns'] / 1e6:>10.1f} {r['total_ns'] / 1e6:>10.1f} "
+              f"{b['total_ns'] / r['total_ns']:>7.2f}x {rss:>15}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stage-by-stage pool generator benchmark")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help="inventory sizes in lines (up to 10,000,000)")
+    parser.add_argument("--variants", nargs="+", choices=sorted(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--output", default="bench_stages.json")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"))
+    parser.add_argument("--child", nargs=2, metavar=("VARIANT", "INPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(*args.child)))
+        return
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    from synth_inventory import write_inventory
+
+    results = []
+    header = " ".join(f"{s[:10]:>10}" for s in STAGES)
+    print(f"{'variant':<12} {'lines':>11} {header} {'total ms':>10} {'lines/s':>12} {'rss MB':>8}")
+    for lines in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            write_inventory(os.path.join(workdir, "fqdn_input.txt"), lines, args.seed)
+            for variant in args.variants:
+                if variant in SCRIPT_VARIANTS:
+                    continue
+                result = run_case(variant, lines, workdir)
+                results.append(result)
+                print_result(result)
+    with tempfile.TemporaryDirectory() as workdir:
+        for variant in args.variants:
+            if variant in SCRIPT_VARIANTS:
+                result = run_case(variant, None, workdir)
+                results.append(result)
+                print_result(result)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results saved as '{args.output}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# 🏁 Dict build + json.dumps vs. precompiled entry templates
+#
+# Usage: python benchmarks/bench_template.py [entries ...] [--shared-constants] [--repeat 3]
+# Encodes the same synthetic rows with encode_chunk_dicts (create_pool_entry
+# then encode_entry) and with encode_chunk (EntryTemplate), checks that the
+# fragments are byte-identical, and prints the best time of each.
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_pool_engine import constants, synthetic_hosts  # noqa: E402
+from pool_engine import compiled_template, encode_chunk, encode_chunk_dicts, hoist_constants  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 500_000]
+
+
+def best_of(repeat, fn, *args):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        result = fn(*args)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dict vs. template pool entry encoding")
+    parser.add_argument("sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--shared-constants", action="store_true", help="encode with hoisted ${CONSTANTS:...} refs")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pool_constants = hoist_constants(constants)[1] if args.shared_constants else constants
+    if compiled_template(pool_constants) is None:
+        sys.exit("❌ Template failed to compile or verify for these constants")
+
+    print(f"{'entries':>10} {'dicts ms':>10} {'template ms':>12} {'speedup':>8}")
+    for n in args.sizes:
+        host_port_list = synthetic_hosts(n // 2)  # two entries per row
+        dict_ns, expected = best_of(args.repeat, encode_chunk_dicts, host_port_list, pool_constants)
+        template_ns, got = best_of(args.repeat, encode_chunk, host_port_list, pool_constants)
+        if got != expected:
+            sys.exit(f"❌ Template output differs from the dict path at {n:,} entries")
+        print(f"{len(got):>10,} {dict_ns / 1e6:>10.1f} {template_ns / 1e6:>12.1f} {dict_ns / template_ns:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
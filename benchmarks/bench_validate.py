@@ -0,0 +1,98 @@
+# 🏁 Original per-line loop vs bulk pre-validation
+#
+# Usage: python benchmarks/bench_validate.py [--lines 1000000] [--block-bytes 65536] [--repeat 3]
+# Validates one synthetic inventory with the original per-line regex loop of
+# jq4.py (baseline_validate below: whole file read, one fqdn_pattern match
+# and a (hostname, port) tuple set per line) and with validator.validate_file
+# (blocks), checks that rows and error messages are identical, and prints the
+# best time of each. --bloom adds bloom_dedup.validate_file_bloom, whose
+# duplicate errors come last.
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bloom_dedup import validate_file_bloom  # noqa: E402
+from synth_inventory import write_inventory  # noqa: E402
+from validator import BLOCK_BYTES, validate_file  # noqa: E402
+
+
+fqdn_pattern = re.compile(r"^(?!-)([a-zA-Z0-9-]{1,63}(?<!-)\.)+[a-zA-Z]{2,63}$")
+
+
+def baseline_validate(path):
+    # The pre-validation loop as jq4.py originally had it
+    with open(path, "r") as f:
+        raw_input = f.read()
+    host_port_list, errors, seen_keys = [], [], set()
+    for i, line in enumerate(raw_input.strip().splitlines(), start=1):
+        parts = line.strip().split()
+        if len(parts) < 2:
+            errors.append(f"Line {i}: Invalid format - '{line.strip()}'")
+            continue
+        fqdn, port = parts[0], parts[1]
+        if not fqdn_pattern.match(fqdn):
+            errors.append(f"Line {i}: Invalid FQDN - '{fqdn}'")
+            continue
+        if not port.isdigit() or not (1 <= int(port) <= 65535):
+            errors.append(f"Line {i}: Invalid TCP port - '{port}'")
+            continue
+        hostname = fqdn.split(".")[0].lower()
+        domain = ".".join(fqdn.split(".")[1:])
+        key = (hostname, port)
+        if key in seen_keys:
+            errors.append(f"Line {i}: Duplicate hostname '{hostname}' and port '{port}'")
+        else:
+            seen_keys.add(key)
+            host_port_list.append((hostname, domain, port))
+    return host_port_list, errors
+
+
+def best_of(repeat, fn):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        result = fn()
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Original per-line loop vs bulk pre-validation benchmark")
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--block-bytes", type=int, default=BLOCK_BYTES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bloom", action="store_true", help="also time the bloom-filter dedup prefilter")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = write_inventory(os.path.join(workdir, "fqdn_input.txt"), args.lines, args.seed)
+        per_line_ns, expected = best_of(args.repeat, lambda: baseline_validate(path))
+        bulk_ns, got = best_of(args.repeat, lambda: validate_file(path, args.block_bytes))
+        if args.bloom:
+            bloom_ns, bloomed = best_of(args.repeat, lambda: validate_file_bloom(path, args.block_bytes))
+            if list(bloomed[0]) != list(got[0]) or sorted(bloomed[1]) != sorted(got[1]):
+                sys.exit("❌ Bloom-prefiltered validation disagrees with the bulk validator")
+
+    if list(got[0]) != expected[0] or got[1] != expected[1]:
+        sys.exit("❌ Bulk validation disagrees with the original per-line loop")
+
+    rows, errors = expected
+    print(f"{args.lines:,} lines: {len(rows):,} valid, {len(errors):,} errors")
+    print(f"{'baseline':<10} {per_line_ns / 1e6:>10.1f} ms {args.lines / (per_line_ns / 1e9):>14,.0f} lines/s")
+    print(f"{'bulk':<10} {bulk_ns / 1e6:>10.1f} ms {args.lines / (bulk_ns / 1e9):>14,.0f} lines/s")
+    print(f"speedup    {per_line_ns / bulk_ns:>10.2f}x")
+    if args.bloom:
+        print(f"{'bloom':<10} {bloom_ns / 1e6:>10.1f} ms {args.lines / (bloom_ns / 1e9):>14,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# 🧪 Synthetic fqdn_input.txt generator for benchmarks
+#
+# Usage: python benchmarks/synth_inventory.py LINES [OUTPUT] [--seed N]
+# Mirrors the shapes seen in real inventories and in jq4.py's default
+# raw_input: mostly valid tab-separated rows, rows pasted twice, bad hostnames,
+# out-of-range ports and the odd malformed line.
+import argparse
+import random
+
+DUPLICATE_RATE = 0.10
+INVALID_FQDN_RATE = 0.01
+BAD_PORT_RATE = 0.01
+BAD_FORMAT_RATE = 0.005
+
+DOMAINS = ["glb.avayacloud.com", "glb.ac.com", "glb.cala.attmx.avayacloud.com"]
+PREFIXES = ["unefonvxmldsmty", "prepag611dsmty", "activavxml502dsmty", "saldovxmlmty", "hbvxmldsmty"]
+BAD_FQDNS = ["bad_host", "invalid.fqdn1", "-lead.glb.ac.com", "trail-.glb.ac.com", "x" * 64 + ".glb.ac.com"]
+BAD_PORTS = ["0", "70000", "99999", "port", "-1"]
+
+
+def iter_synthetic_lines(lines, seed=0):
+    rng = random.Random(seed)
+    previous = None
+    for i in range(lines):
+        roll = rng.random()
+        if previous and roll < DUPLICATE_RATE:
+            line = previous
+        elif roll < DUPLICATE_RATE + INVALID_FQDN_RATE:
+            line = f"{rng.choice(BAD_FQDNS)}\t{rng.randint(1, 65535)}"
+        elif roll < DUPLICATE_RATE + INVALID_FQDN_RATE + BAD_PORT_RATE:
+            line = f"{rng.choice(PREFIXES)}{i}.{rng.choice(DOMAINS)}\t{rng.choice(BAD_PORTS)}"
+        elif roll < DUPLICATE_RATE + INVALID_FQDN_RATE + BAD_PORT_RATE + BAD_FORMAT_RATE:
+            line = f"{rng.choice(PREFIXES)}{i}.{rng.choice(DOMAINS)}"
+        else:
+            line = f"{rng.choice(PREFIXES)}{i}.{rng.choice(DOMAINS)}\t{rng.randint(10000, 19999)}"
+        previous = line
+        yield line
+
+
+def write_inventory(path, lines, seed=0):
+    with open(path, "w") as f:
+        for line in iter_synthetic_lines(lines, seed):
+            f.write(line)
+            f.write("\n")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic fqdn_input.txt")
+    parser.add_argument("lines", type=int)
+    parser.add_argument("output", nargs="?", default="fqdn_input.txt")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_inventory(args.output, args.lines, args.seed)
+    print(f"Wrote {args.lines:,} lines to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# 🌸 Bloom-filter prefilter for duplicate detection
+#
+# BulkValidator keeps every (hostname, port) key in `seen_keys`, although in
+# most inventories almost every key is unique. BloomValidator keeps a bloom
+# filter sized from the input instead, and only keys the filter cannot rule
+# out reach an exact set:
+#   1. while validating, each block's keys are probed against the filter and
+#      then added to it; a key that may have been seen (a probe hit, or a
+#      repeat inside the block) becomes a candidate, and the row is noted
+#   2. at finish(), one pass over the rows checks just the candidate keys
+#      exactly: the first row of each keeps, later rows are duplicates
+# The second occurrence of a key always hits the filter, so every duplicate
+# is a candidate and results stay exact; a false positive only costs a
+# candidate that turns out unique. The filter uses one byte per slot so
+# probing and inserting a block are C-level map passes, at SLOTS_PER_KEY
+# bytes a key instead of the tens of bytes of a key string in a set.
+#
+# Duplicate rows are only known at finish(), so their errors are reported
+# after the other errors, in line order.
+import os
+from collections import deque
+from itertools import compress, repeat
+from operator import add, mod, mul, or_, rshift
+
+from validator import BLOCK_BYTES, BulkValidator, check_block, iter_blocks
+
+SLOTS_PER_KEY = 10
+PROBES = 3  # ~1.7% false positives at 10 slots per key
+MIN_SLOTS = 1 << 16
+KEY_FORMAT = "{}:{}".format  # duplicate_key() without a Python call per row
+SAMPLE_BYTES = 1 << 16  # read to estimate the row count from the file size
+
+
+class BloomFilter:
+    def __init__(self, expected_keys, slots_per_key=SLOTS_PER_KEY, probes=PROBES):
+        self.size = max(MIN_SLOTS, int(expected_keys * slots_per_key))
+        self.probes = probes
+        self.slots = bytearray(self.size)
+
+    def _positions(self, keys):
+        # Double hashing off the built-in str hash, so the filter is only
+        # meaningful inside one process
+        hashes = list(map(hash, keys))
+        yield list(map(mod, hashes, repeat(self.size)))
+        steps = list(map(or_, map(rshift, hashes, repeat(32)), repeat(1)))
+        for i in range(1, self.probes):
+            yield list(map(mod, map(add, hashes, map(mul, steps, repeat(i))), repeat(self.size)))
+
+    def add_all(self, keys):
+        # Adds `keys`; returns a bytearray flagging each key that may already
+        # have been added, before this call or earlier in `keys`
+        probes = list(self._positions(keys))
+        possible = bytearray(map(min, *(map(self.slots.__getitem__, positions) for positions in probes)))
+        for positions in probes:
+            deque(map(self.slots.__setitem__, positions, repeat(1)), 0)
+        if len(set(keys)) != len(keys):
+            # Filled back to front, so every key maps to its first position
+            first = dict(zip(reversed(keys), range(len(keys) - 1, -1, -1)))
+            for j, key in enumerate(keys):
+                if first[key] != j:
+                    possible[j] = 1
+        return possible
+
+
+class BloomValidator(BulkValidator):
+    def __init__(self, expected_rows, errors=None, slots_per_key=SLOTS_PER_KEY, probes=PROBES):
+        super().__init__(errors)
+        self.seen_keys = None  # replaced by the filter and the candidates
+        self.bloom = BloomFilter(expected_rows, slots_per_key, probes)
+        self.candidates = set()  # keys that may occur more than once
+        self.suspects = {}  # row index -> line number, for rows whose key hit the filter
+
+    def _validate_block(self, body):
+        base = self.line_no + 1
+        n, problems, regular, hostnames, domains, ports = check_block(body)
+        self.line_no += n
+        if problems:
+            self.errors.extend(f"Line {base + i}: {problems[i]}" for i in sorted(problems))
+        if not hostnames:
+            return
+
+        keys = list(map(KEY_FORMAT, hostnames, ports))
+        first_row = len(self.host_port_list)
+        for j in compress(range(len(keys)), self.bloom.add_all(keys)):
+            self.candidates.add(keys[j])
+            self.suspects[first_row + j] = base + regular[j]
+        self.host_port_list.extend_columns(hostnames, domains, ports)
+
+    def finish(self):
+        self._carry = ""
+        if not self.candidates:
+            return self.host_port_list, self.errors
+
+        candidates = self.candidates
+        seen_keys = set()
+        keep = bytearray(b"\x01") * len(self.host_port_list)
+        duplicates = []
+        for first, hostnames, _, ports in self.host_port_list.column_chunks():
+            keys = list(map(KEY_FORMAT, hostnames, ports))
+            for j in compress(range(len(keys)), map(candidates.__contains__, keys)):
+                if keys[j] in seen_keys:
+                    keep[first + j] = 0
+                    duplicates.append((self.suspects[first + j], hostnames[j], ports[j]))
+                else:
+                    seen_keys.add(keys[j])
+
+        if duplicates:
+            self.host_port_list = self.host_port_list.select(keep)
+            self.errors.extend(f"Line {line_no}: Duplicate hostname '{hostname}' and port '{port}'"
+                               for line_no, hostname, port in duplicates)
+        self.candidates = set()
+        self.suspects = {}
+        return self.host_port_list, self.errors
+
+
+def estimate_rows(path, sample_bytes=SAMPLE_BYTES):
+    # Rows in the file, from its size and the line length of its first block
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    lines = sample.count(b"\n") + (not sample.endswith(b"\n"))
+    return max(1, size * lines // max(len(sample), 1))
+
+
+def validate_file_bloom(path, block_bytes=BLOCK_BYTES, errors=None, slots_per_key=SLOTS_PER_KEY, probes=PROBES):
+    # Same rows and the same error messages as validator.validate_file(),
+    # with duplicate errors last
+    validator = BloomValidator(estimate_rows(path), errors, slots_per_key, probes)
+    with open(path, "r") as f:
+        for block in iter_blocks(f, block_bytes):
+            validator.feed(block)
+    return validator.finish()
@@ -0,0 +1,75 @@
+# 🧮 Bounded, aggregated validation error reporting
+#
+# The validators append "Line N: message" strings to whatever `errors` sink
+# they are given (a plain list by default). ErrorCollector is a drop-in sink
+# that keeps memory bounded however bad the input is: it counts errors per
+# category, keeps only the first few examples of each, and optionally streams
+# every error line to a side file for the full detail.
+CATEGORIES = (
+    ("Invalid format", "format"),
+    ("Invalid FQDN", "fqdn"),
+    ("Invalid TCP port", "port"),
+    ("Invalid port", "port"),  # jq5 wording
+    ("Duplicate hostname", "duplicate"),
+)
+DEFAULT_EXAMPLES = 5
+
+
+def category_of(message):
+    for prefix, category in CATEGORIES:
+        if message.startswith(prefix):
+            return category
+    return "other"
+
+
+class ErrorCollector:
+    def __init__(self, max_examples=DEFAULT_EXAMPLES, detail_path=None):
+        self.max_examples = max_examples
+        self.detail_path = detail_path
+        self.total = 0
+        self.counts = {}  # category -> count, in order of first appearance
+        self.examples = {}  # category -> first max_examples error lines
+        self._detail = None
+
+    def append(self, error):
+        category = category_of(error.partition(": ")[2])
+        self.total += 1
+        count = self.counts[category] = self.counts.get(category, 0) + 1
+        if count <= self.max_examples:
+            self.examples.setdefault(category, []).append(error)
+        if self.detail_path:
+            if self._detail is None:
+                self._detail = open(self.detail_path, "w")
+            self._detail.write(f"{error}\n")
+
+    def extend(self, errors):
+        for error in errors:
+            self.append(error)
+
+    def __len__(self):
+        return self.total
+
+    def close(self):
+        if self._detail is not None:
+            self._detail.close()
+            self._detail = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def as_dict(self):
+        return {"total": self.total, "counts": dict(self.counts), "examples": dict(self.examples)}
+
+    def summary_lines(self):
+        # Printable report: one line per category, its examples indented below
+        for category, count in self.counts.items():
+            yield f" - {category}: {count:,}"
+            examples = self.examples.get(category, [])
+            for error in examples:
+                yield f"    {error}"
+            if count > len(examples):
+                yield f"    … {count - len(examples):,} more"
@@ -0,0 +1,131 @@
+# 💽 External-memory sort and dedup for inventories larger than RAM
+#
+# The in-memory validators keep every (hostname, port) key in a set and every
+# valid row in a HostStore. This mode keeps neither:
+#   1. the inventory is validated block by block exactly as validator.py does
+#      it, minus duplicate detection; each valid row becomes a
+#      "hostname<TAB>port<TAB>line_no<TAB>domain" record, and every
+#      `run_rows` records are sorted and spilled to a temp file
+#   2. the runs are k-way merged (in rounds of at most MAX_FAN_IN files), so
+#      records arrive grouped by (hostname, port) and ordered by line number
+#      within a group: the first one is kept, the rest are duplicates
+# Line numbers are zero-padded so plain string order is (hostname, port,
+# line_no) order, and sorting and merging never parse a record.
+#
+# Rows come out sorted by (hostname, port) rather than in file order, which
+# makes the POOLS output deterministic for a given set of rows. Duplicate
+# errors are reported during the merge, in that same order, after the format,
+# FQDN and port errors of the first pass. Memory is one run's records plus
+# one buffered line per merged file.
+import heapq
+import os
+import shutil
+import tempfile
+
+from validator import BLOCK_BYTES, BulkValidator, check_block, iter_blocks
+
+RUN_ROWS = 500_000  # records sorted in memory per spilled run
+MAX_FAN_IN = 64  # runs merged at once; more are merged in rounds
+LINE_DIGITS = 12
+
+
+class ExternalDedup(BulkValidator):
+    def __init__(self, errors=None, run_rows=RUN_ROWS, tmp_dir=None):
+        super().__init__(errors)
+        self.host_port_list = None  # rows live in the spilled runs instead
+        self.run_rows = run_rows
+        self.rows = 0  # unique rows, known once iterated
+        self.duplicates = 0
+        self._tmp_dir = tempfile.mkdtemp(prefix="pool_runs_", dir=tmp_dir)
+        self._runs = []
+        self._records = []
+
+    def add_file(self, path, block_bytes=BLOCK_BYTES):
+        with open(path, "r") as f:
+            for block in iter_blocks(f, block_bytes):
+                self.feed(block)
+        return self
+
+    def _validate_block(self, body):
+        base = self.line_no + 1
+        n, problems, regular, hostnames, domains, ports = check_block(body)
+        self.line_no += n
+        if problems:
+            self.errors.extend(f"Line {base + i}: {problems[i]}" for i in sorted(problems))
+
+        records = self._records
+        for i, hostname, domain, port in zip(regular, hostnames, domains, ports):
+            records.append(f"{hostname}\t{port}\t{base + i:0{LINE_DIGITS}d}\t{domain}\n")
+        if len(records) >= self.run_rows:
+            self._spill()
+
+    def _spill(self):
+        if not self._records:
+            return
+        self._records.sort()
+        self._runs.append(self._write_run(self._records))
+        self._records = []
+
+    def _write_run(self, records):
+        fd, path = tempfile.mkstemp(suffix=".run", dir=self._tmp_dir)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(records)
+        return path
+
+    def _merge_rounds(self):
+        # Merges runs MAX_FAN_IN at a time until one final merge is left
+        while len(self._runs) > MAX_FAN_IN:
+            merged = []
+            for start in range(0, len(self._runs), MAX_FAN_IN):
+                group = self._runs[start:start + MAX_FAN_IN]
+                files = [open(path, "r", encoding="utf-8") for path in group]
+                try:
+                    merged.append(self._write_run(heapq.merge(*files)))
+                finally:
+                    for f in files:
+                        f.close()
+                for path in group:
+                    os.remove(path)
+            self._runs = merged
+
+    def __iter__(self):
+        # Yields the unique (hostname, domain, port) rows in (hostname, port)
+        # order; the pass also reports every duplicate to `errors`
+        self.finish()
+        if self._runs:
+            self._spill()
+            self._merge_rounds()
+            files = [open(path, "r", encoding="utf-8") for path in self._runs]
+            records = heapq.merge(*files)
+        else:
+            # Everything fit in one run: no need to touch the disk
+            files = []
+            self._records.sort()
+            records = self._records
+        self.rows = self.duplicates = 0
+        try:
+            previous = None
+            for record in records:
+                hostname, port, line_no, domain = record[:-1].split("\t")
+                if (hostname, port) == previous:
+                    self.duplicates += 1
+                    self.errors.append(f"Line {int(line_no)}: Duplicate hostname '{hostname}' and port '{port}'")
+                    continue
+                previous = (hostname, port)
+                self.rows += 1
+                yield hostname, domain, port
+        finally:
+            for f in files:
+                f.close()
+
+    def close(self):
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+        self._runs = []
+        self._records = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
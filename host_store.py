@@ -0,0 +1,134 @@
+# 🗜️ Compact columnar store for validated (hostname, domain, port) rows
+#
+# A list of 3-tuples costs a tuple plus two or three fresh strings per row.
+# HostStore keeps the same rows as columns instead:
+#   - hostnames packed into one ASCII bytearray, with an array of end offsets
+#   - domains interned once each, rows keep an index into that table
+#   - ports in an array('H'); the rare port spelled differently from str(int)
+#     (e.g. "0080") is kept verbatim on the side so pool keys do not change
+# Iterating yields (hostname, domain, port) tuples lazily, so it drops in
+# wherever host_port_list was iterated (build_pools, calibrate, run_plan,
+# the build cache).
+import sys
+from array import array
+from itertools import accumulate, compress, islice, repeat
+from operator import is_, sub
+
+PORT_STRINGS = tuple(str(port) for port in range(65536))
+PORT_NUMBERS = {port: number for number, port in enumerate(PORT_STRINGS)}
+
+
+def duplicate_key(hostname, port):
+    # One compact string per (hostname, port) for duplicate detection;
+    # hostnames never contain ":"
+    return f"{hostname}:{port}"
+
+
+class HostStore:
+    def __init__(self, rows=()):
+        self._hostnames = bytearray()
+        self._ends = array("Q")
+        self._domain_ids = array("I")
+        self._ports = array("H")
+        self._port_overrides = {}  # row -> port string that is not str(int(port))
+        self._domains = []
+        self._domain_index = {}
+        for row in rows:
+            self.append(*row)
+
+    def _domain_id(self, domain):
+        domain_id = self._domain_index.get(domain)
+        if domain_id is None:
+            domain_id = len(self._domains)
+            domain = sys.intern(domain)
+            self._domains.append(domain)
+            self._domain_index[domain] = domain_id
+        return domain_id
+
+    def append(self, hostname, domain, port):
+        self._hostnames += hostname.encode("ascii")
+        self._ends.append(len(self._hostnames))
+        self._domain_ids.append(self._domain_id(domain))
+        number = int(port)
+        if PORT_STRINGS[number] != port:
+            self._port_overrides[len(self._ports)] = port
+        self._ports.append(number)
+
+    def extend_columns(self, hostnames, domains, ports):
+        # Bulk append of three equal-length columns (the bulk validator's output)
+        if not hostnames:
+            return
+        first = len(self._ports)
+        offset = len(self._hostnames)
+        self._hostnames += "".join(hostnames).encode("ascii")
+        self._ends.extend(accumulate(map(len, hostnames), initial=offset))
+        self._ends.pop(first)  # drop `initial`, it is the previous row's end
+        index = self._domain_index
+        for domain in dict.fromkeys(domains):  # new domains get ids in first-seen order
+            if domain not in index:
+                self._domain_id(domain)
+        self._domain_ids.extend(map(index.__getitem__, domains))
+        numbers = list(map(PORT_NUMBERS.get, ports))  # None for a port spelled like "0080"
+        if None in numbers:
+            for i in compress(range(len(numbers)), map(is_, numbers, repeat(None))):
+                numbers[i] = int(ports[i])
+                self._port_overrides[first + i] = ports[i]
+        self._ports.extend(numbers)
+
+    def column_chunks(self, chunk_rows=1 << 16):
+        # Yields (first row, hostnames, domains, ports) column lists, a chunk
+        # at a time, with the slicing done by C-level map passes
+        for first in range(0, len(self), chunk_rows):
+            yield (first, *self._columns(first, min(first + chunk_rows, len(self))))
+
+    def _columns(self, first, last):
+        ends = self._ends
+        start = ends[first - 1] if first else 0
+        text = self._hostnames[start:ends[last - 1]].decode("ascii")
+        stops = list(map(sub, ends[first:last], repeat(start)))
+        hostnames = list(map(text.__getitem__, map(slice, [0] + stops[:-1], stops)))
+        domains = list(map(self._domains.__getitem__, self._domain_ids[first:last]))
+        ports = list(map(PORT_STRINGS.__getitem__, self._ports[first:last]))
+        for row, port in self._port_overrides.items():
+            if first <= row < last:
+                ports[row - first] = port
+        return hostnames, domains, ports
+
+    def select(self, keep, chunk_rows=1 << 16):
+        # New store with only the rows whose `keep` flag is set
+        selected = HostStore()
+        for first, *columns in self.column_chunks(chunk_rows):
+            mask = keep[first:first + len(columns[0])]
+            selected.extend_columns(*(list(compress(column, mask)) for column in columns))
+        return selected
+
+    def __len__(self):
+        return len(self._ports)
+
+    def __iter__(self):
+        return self._iter_range(0, len(self._ports))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return list(self._iter_range(start, max(start, stop)))
+            return list(islice(self, start, stop, step))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("HostStore index out of range")
+        return next(self._iter_range(index, index + 1))
+
+    def _iter_range(self, first, last):
+        hostnames = self._hostnames
+        ends = self._ends
+        domains = self._domains
+        overrides = self._port_overrides
+        start = ends[first - 1] if first else 0
+        for i in range(first, last):
+            end = ends[i]
+            port = overrides.get(i) if overrides else None
+            yield (hostnames[start:end].decode("ascii"), domains[self._domain_ids[i]],
+                   port or PORT_STRINGS[self._ports[i]])
+            start = end
@@ -0,0 +1,160 @@
+# 📥 Streaming readers for the tab-separated FQDN/port inventory (fqdn_input.txt)
+#
+# Records are yielded as (line_no, fqdn, port). Line numbers follow the old
+# `raw_input.strip().splitlines()` numbering: leading blank lines are not
+# counted and trailing blank lines are dropped. A line without both fields is
+# yielded as (line_no, stripped_line, None) so the caller can report it.
+#
+# Big inventories can be parsed straight off an mmap instead of through the
+# text layer: the mapping is walked in line-aligned chunks decoded from
+# memoryview slices, and a chunk made only of clean "fqdn<TAB>port" lines is
+# split into its two columns with C-level str passes, with no per-line
+# strip/split copies. Any other chunk (spaces, CR, extra columns, non-ASCII)
+# goes through the same strip/split as iter_lines, so records are identical.
+import locale
+import mmap
+import os
+from itertools import repeat
+
+MMAP_THRESHOLD = 64 << 20  # bytes; read_inventory() maps files at least this big
+MMAP_CHUNK_BYTES = 1 << 16
+OTHER_WHITESPACE = " \r\x0b\x0c\x1c\x1d\x1e\x1f"  # str.split() separators besides \t and \n
+
+
+def iter_lines(lines):
+    line_no = 0
+    pending_blanks = 0
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            # Only count blanks once a later non-blank line proves they were
+            # not trailing whitespace.
+            if line_no:
+                pending_blanks += 1
+            continue
+
+        while pending_blanks:
+            line_no += 1
+            pending_blanks -= 1
+            yield line_no, "", None
+
+        line_no += 1
+        parts = stripped.split()
+        if len(parts) < 2:
+            yield line_no, stripped, None
+        else:
+            yield line_no, parts[0], parts[1]
+
+
+def iter_inventory(path):
+    with open(path, "r") as f:
+        yield from iter_lines(f)
+
+
+def _universal_lines(text):
+    # `text` ends on a line boundary; split it the way text mode would (LF,
+    # CRLF and lone CR all end a line)
+    if text.endswith("\n"):
+        text = text[:-1]
+        if text.endswith("\r"):
+            text = text[:-1]
+    return text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+
+
+def _clean_fields(text):
+    # (fqdns, ports) when every line of `text` is exactly "fqdn<TAB>port" with
+    # nothing else str.split() would treat as whitespace, else None
+    if not text.isascii() or any(char in text for char in OTHER_WHITESPACE):
+        return None
+    lines = text[:-1].split("\n") if text.endswith("\n") else text.split("\n")
+    if any(map((1).__ne__, map(str.count, lines, repeat("\t")))):
+        return None
+    fields = "\t".join(lines).split("\t")
+    if "" in fields:
+        return None
+    return fields[0::2], fields[1::2]
+
+
+def _iter_mapped(mm, view, encoding, chunk_bytes):
+    size = len(mm)
+    line_no = 0
+    pending_blanks = 0
+    start = 0
+    while start < size:
+        end = mm.find(b"\n", min(start + chunk_bytes, size) - 1)
+        end = size if end == -1 else end + 1
+        try:
+            clean = _clean_fields(str(view[start:end], "ascii"))
+        except UnicodeDecodeError:
+            clean = None
+
+        if clean:
+            fqdns, ports = clean
+            while pending_blanks:
+                line_no += 1
+                pending_blanks -= 1
+                yield line_no, "", None
+            yield from zip(range(line_no + 1, line_no + 1 + len(fqdns)), fqdns, ports)
+            line_no += len(fqdns)
+        else:
+            for line in _universal_lines(str(view[start:end], encoding)):
+                stripped = line.strip()
+                if not stripped:
+                    if line_no:
+                        pending_blanks += 1
+                    continue
+                while pending_blanks:
+                    line_no += 1
+                    pending_blanks -= 1
+                    yield line_no, "", None
+                line_no += 1
+                parts = stripped.split()
+                if len(parts) < 2:
+                    yield line_no, stripped, None
+                else:
+                    yield line_no, parts[0], parts[1]
+        start = end
+
+
+def iter_inventory_mmap(path, encoding=None, chunk_bytes=MMAP_CHUNK_BYTES):
+    encoding = encoding or locale.getpreferredencoding(False)  # what open(path, "r") uses
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return  # an empty file cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                yield from _iter_mapped(mm, view, encoding, chunk_bytes)
+            finally:
+                view.release()
+
+
+def iter_mapped_blocks(path, block_bytes, encoding=None):
+    # Text blocks of ~block_bytes ending on a line boundary, decoded straight
+    # from the mapping (the bulk validator's input when the file is mapped)
+    encoding = encoding or locale.getpreferredencoding(False)
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                size = len(mm)
+                start = 0
+                while start < size:
+                    end = mm.find(b"\n", min(start + block_bytes, size) - 1)
+                    end = size if end == -1 else end + 1
+                    block = str(view[start:end], encoding)
+                    if "\r" in block:
+                        block = block.replace("\r\n", "\n").replace("\r", "\n")
+                    yield block
+                    start = end
+            finally:
+                view.release()
+
+
+def read_inventory(path, mmap_threshold=MMAP_THRESHOLD):
+    # Picks the reader by file size; mmap_threshold=None always uses text mode
+    if mmap_threshold is not None and os.path.getsize(path) >= mmap_threshold:
+        return iter_inventory_mmap(path)
+    return iter_inventory(path)
@@ -1,4 +1,4 @@
-import json
+from pool_writer import PoolJsonWriter
 
 hostnames = [
 "hostname1",
@@ -27,28 +27,22 @@ header_updates = [
     }
 ]
 
-pools = {}
+with PoolJsonWriter("pools_output.json") as writer:
+    for host in hostnames:
+        base_name = host.upper()
+        pool_name = f"CUSTOMER_{base_name}_15070"
+        regex_https = f"^https://({host}[.]glb[.]ac[.]com):443/"
+        regex_http = f"^http://({host}[.]glb[.]ac[.]com):443/"
 
-for host in hostnames:
-    base_name = host.upper()
-    pool_name = f"CUSTOMER_{base_name}_15070"
-    regex_https = f"^https://({host}[.]glb[.]ac[.]com):443/"
-    regex_http = f"^http://({host}[.]glb[.]ac[.]com):443/"
-    
-    for protocol in ["HTTPS", "HTTP"]:
-        pools[f"{pool_name}_{protocol}"] = {
-            "description": f"{pool_name} {protocol} Pool Selection",
-            "excludeLog": False,
-            "localSubnets": local_subnets,
-            "poolName": pool_name,
-            "regexUrl": regex_https if protocol == "HTTPS" else regex_http,
-            "urlQueryStringReplaceEncodeFull": True,
-            "urlQueryStringReplace": url_rewrites,
-            "responseHeadersUpdate": header_updates,
-            "whitelist": whitelist
-        }
-
-output = {"POOLS": pools}
-
-with open("pools_output.json", "w") as f:
-    json.dump(output, f, indent=2)
\ No newline at end of file
+        for protocol in ["HTTPS", "HTTP"]:
+            writer.write(f"{pool_name}_{protocol}", {
+                "description": f"{pool_name} {protocol} Pool Selection",
+                "excludeLog": False,
+                "localSubnets": local_subnets,
+                "poolName": pool_name,
+                "regexUrl": regex_https if protocol == "HTTPS" else regex_http,
+                "urlQueryStringReplaceEncodeFull": True,
+                "urlQueryStringReplace": url_rewrites,
+                "responseHeadersUpdate": header_updates,
+                "whitelist": whitelist
+            })
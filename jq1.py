@@ -1,4 +1,4 @@
-import json
+from pool_writer import PoolJsonWriter
 
 hostnames = [
     "hostname1",
@@ -31,35 +31,29 @@ header_updates = [
     }
 ]
 
-pools = {}
-
-for host in hostnames:
-    base_name = host.upper()
-    pool_name = f"CUSTOMER_{base_name}_15070"
-    regex_https = f"^https://({host}[.]glb[.]ac[.]com):443/"
-    regex_http = f"^http://({host}[.]glb[.]ac[.]com):443/"
-
-    for protocol in ["HTTPS", "HTTP"]:
-        pool_key = f"{pool_name}_{protocol}"
-        pool_config = {
-            "description": f"{pool_name} {protocol} Pool Selection",
-            "excludeLog": False,
-            "localSubnets": local_subnets,
-            "poolName": pool_name,
-            "regexUrl": regex_https if protocol == "HTTPS" else regex_http,
-            "urlQueryStringReplaceEncodeFull": True,
-            "urlQueryStringReplace": url_rewrites,
-            "responseHeadersUpdate": header_updates,
-        }
-
-        if isinstance(whitelist, str):
-            pool_config["whitelist"] = f"${{{whitelist}}}"
-        else:
-            pool_config["whitelist"] = whitelist
-
-        pools[pool_key] = pool_config
-
-output = {"POOLS": pools}
-
-with open("pools_output.json", "w") as f:
-    json.dump(output, f, indent=2)
+with PoolJsonWriter("pools_output.json") as writer:
+    for host in hostnames:
+        base_name = host.upper()
+        pool_name = f"CUSTOMER_{base_name}_15070"
+        regex_https = f"^https://({host}[.]glb[.]ac[.]com):443/"
+        regex_http = f"^http://({host}[.]glb[.]ac[.]com):443/"
+
+        for protocol in ["HTTPS", "HTTP"]:
+            pool_key = f"{pool_name}_{protocol}"
+            pool_config = {
+                "description": f"{pool_name} {protocol} Pool Selection",
+                "excludeLog": False,
+                "localSubnets": local_subnets,
+                "poolName": pool_name,
+                "regexUrl": regex_https if protocol == "HTTPS" else regex_http,
+                "urlQueryStringReplaceEncodeFull": True,
+                "urlQueryStringReplace": url_rewrites,
+                "responseHeadersUpdate": header_updates,
+            }
+
+            if isinstance(whitelist, str):
+                pool_config["whitelist"] = f"${{{whitelist}}}"
+            else:
+                pool_config["whitelist"] = whitelist
+
+            writer.write(pool_key, pool_config)
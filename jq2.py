@@ -1,4 +1,4 @@
-import json
+from pool_writer import PoolJsonWriter
 
 # Paste raw FQDNs as multiline string (simulating copy-paste from Excel)
 raw_fqdn_input = """
@@ -37,36 +37,30 @@ header_updates = [
 ]
 
 
-pools = {}
+with PoolJsonWriter("pools_output.json") as writer:
+    for host in hostnames:
+        base_name = host.upper()
+        pool_name = f"CUSTOMER_{base_name}_15070"
+        regex_https = f"^https://({host}[.]glb[.]ac[.]com):443/"
+        regex_http = f"^http://({host}[.]glb[.]ac[.]com):443/"
 
-for host in hostnames:
-    base_name = host.upper()
-    pool_name = f"CUSTOMER_{base_name}_15070"
-    regex_https = f"^https://({host}[.]glb[.]ac[.]com):443/"
-    regex_http = f"^http://({host}[.]glb[.]ac[.]com):443/"
+        for protocol in ["HTTPS", "HTTP"]:
+            pool_key = f"{pool_name}_{protocol}"
+            pool_config = {
+                "description": f"{pool_name} {protocol} Pool Selection",
+                "excludeLog": False,
+                "localSubnets": local_subnets,
+                "poolName": pool_name,
+                "regexUrl": regex_https if protocol == "HTTPS" else regex_http,
+                "urlQueryStringReplaceEncodeFull": True,
+                "urlQueryStringReplace": url_rewrites,
+                "responseHeadersUpdate": header_updates,
+            }
 
-    for protocol in ["HTTPS", "HTTP"]:
-        pool_key = f"{pool_name}_{protocol}"
-        pool_config = {
-            "description": f"{pool_name} {protocol} Pool Selection",
-            "excludeLog": False,
-            "localSubnets": local_subnets,
-            "poolName": pool_name,
-            "regexUrl": regex_https if protocol == "HTTPS" else regex_http,
-            "urlQueryStringReplaceEncodeFull": True,
-            "urlQueryStringReplace": url_rewrites,
-            "responseHeadersUpdate": header_updates,
-        }
+            # Handle variable-based or static whitelist
+            if isinstance(whitelist, str):
+                pool_config["whitelist"] = f"${{{whitelist}}}"
+            else:
+                pool_config["whitelist"] = whitelist
 
-        # Handle variable-based or static whitelist
-        if isinstance(whitelist, str):
-            pool_config["whitelist"] = f"${{{whitelist}}}"
-        else:
-            pool_config["whitelist"] = whitelist
-
-        pools[pool_key] = pool_config
-
-output = {"POOLS": pools}
-
-with open("pools_output.json", "w") as f:
-    json.dump(output, f, indent=2)
+            writer.write(pool_key, pool_config)
@@ -1,4 +1,4 @@
-import json
+from pool_writer import PoolJsonWriter
 
 # 📋 Paste your FQDN-port mappings below
 raw_input = """
@@ -306,39 +306,32 @@ header_updates = [
 
 
 
-# ⚙️ Generate POOLS
-pools = {}
+# ⚙️ Generate POOLS and 📝 stream them to JSON
+with PoolJsonWriter("pools_output.json") as writer:
+    for hostname, domain, port in host_port_list:
+        base_name = hostname.upper()
+        pool_name = f"CUSTOMER_{base_name}_{port}"
 
-for hostname, domain, port in host_port_list:
-    base_name = hostname.upper()
-    pool_name = f"CUSTOMER_{base_name}_{port}"
-
-    # Use [.] instead of \. in regex
-    escaped_fqdn = f"{hostname}" + ''.join(f"[.]{part}" for part in domain.split("."))
-
-    regex_https = f"^https://({escaped_fqdn}):443/"
-    regex_http = f"^http://({escaped_fqdn}):443/"
-
-    for protocol in ["HTTPS", "HTTP"]:
-        pool_key = f"{pool_name}_{protocol}"
-        pool_config = {
-            "description": f"{pool_name} {protocol} Pool Selection",
-            "excludeLog": False,
-            "localSubnets": local_subnets,
-            "poolName": pool_name,
-            "regexUrl": regex_https if protocol == "HTTPS" else regex_http,
-            "urlQueryStringReplaceEncodeFull": True,
-            "urlQueryStringReplace": url_rewrites,
-            "responseHeadersUpdate": header_updates,
-        }
+        # Use [.] instead of \. in regex
+        escaped_fqdn = f"{hostname}" + ''.join(f"[.]{part}" for part in domain.split("."))
 
-        # 🔄 Dynamic whitelist
-        pool_config["whitelist"] = f"${{{whitelist}}}" if isinstance(whitelist, str) else whitelist
+        regex_https = f"^https://({escaped_fqdn}):443/"
+        regex_http = f"^http://({escaped_fqdn}):443/"
 
-        pools[pool_key] = pool_config
+        for protocol in ["HTTPS", "HTTP"]:
+            pool_key = f"{pool_name}_{protocol}"
+            pool_config = {
+                "description": f"{pool_name} {protocol} Pool Selection",
+                "excludeLog": False,
+                "localSubnets": local_subnets,
+                "poolName": pool_name,
+                "regexUrl": regex_https if protocol == "HTTPS" else regex_http,
+                "urlQueryStringReplaceEncodeFull": True,
+                "urlQueryStringReplace": url_rewrites,
+                "responseHeadersUpdate": header_updates,
+            }
 
-# 📝 Output JSON
-output = {"POOLS": pools}
+            # 🔄 Dynamic whitelist
+            pool_config["whitelist"] = f"${{{whitelist}}}" if isinstance(whitelist, str) else whitelist
 
-with open("pools_output.json", "w") as f:
-    json.dump(output, f, indent=2)
+            writer.write(pool_key, pool_config)
@@ -1,36 +1,34 @@
-import json
 import re
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor
+
+from error_report import ErrorCollector
+from host_store import HostStore, duplicate_key
+from inventory import read_inventory
+from pool_engine import create_pool_entry, describe_plan
+from pool_profile import StageProfiler
+from pool_shards import manifest_path, verify_shards, write_shards
+from pool_verify import verify_output
+from poolgen import default_constants, pool_constants, update_rows, validate_file, write_rows
 
 # 🔧 Configuration
 TEST_MODE = False  # Set to True to only run validation (no JSON output)
 FQDN_FILE = "fqdn_input.txt"
 OUTPUT_JSON = "pools_output.json"
-
-# 🛡️ Constants
-whitelist = "CONSTANTS:my_whitelist"
-local_subnets = ["100.116.121.0/24", "100.124.121.0/24"]
-
-url_rewrites = [
-    {
-        "regex": "100[.]116[.]123[.]240",
-        "replace": "epm.glb.cala.attmx.avayacloud.com"
-    },
-    {
-        "regex": "100[.]124[.]123[.]240",
-        "replace": "epmgeo.glb.cala.attmx.avayacloud.com"
-    }
-]
-
-header_updates = [
-    {
-        "header": "TerminationURL",
-        "regex": "http",
-        "replace": "https"
-    }
-]
+SHARED_CONSTANTS = False  # Set to True to emit repeated blocks once under CONSTANTS and reference them
+INCREMENTAL = True  # Reuse unchanged rows from the previous pools_output.json (cache kept beside it)
+BULK_VALIDATION = True  # Validate the input in blocks (validator.py); False uses the per-line loop below
+VALIDATION_WORKERS = None  # Processes for bulk pre-validation of inputs over 32 MiB (None = one per CPU, 1 = off)
+BLOOM_DEDUP = False  # Bloom-filter prefilter before the exact duplicate check: far less memory, one process
+MMAP_THRESHOLD = 64 << 20  # Parse inputs at least this many bytes straight off an mmap; None to never
+ERROR_EXAMPLES = 5  # Examples kept and printed per error category
+ERROR_DETAIL_FILE = None  # e.g. "validation_errors.txt" to also keep every error line on disk
+SHARDS = 0  # Split POOLS into this many files plus a manifest (0 keeps the single pools_output.json)
+SHARD_BY = "hash"  # "hash" of the pool name or "port"
+
+# 🛡️ Constants (whitelist, localSubnets, urlQueryStringReplace, responseHeadersUpdate)
+# are poolgen.py's defaults, shared with the CLI and the web endpoint
+constants = default_constants()
 
 fqdn_pattern = re.compile(r"^(?!-)([a-zA-Z0-9-]{1,63}(?<!-)\.)+[a-zA-Z]{2,63}$")
 
@@ -44,116 +42,135 @@ bad_host	99999
 invalid.fqdn	70000
 """
 
-# 🗃️ Load or create input file
-if not os.path.exists(FQDN_FILE):
-    print(f"📄 Creating {FQDN_FILE} from default raw input...")
-    with open(FQDN_FILE, "w") as f:
-        f.write(raw_input.strip())
-else:
-    print(f"📥 Loading FQDNs from existing {FQDN_FILE}...")
-    with open(FQDN_FILE, "r") as f:
-        raw_input = f.read()
-
-# ⏱️ Start timing in nanoseconds
-start_ns = time.perf_counter_ns()
-
-# ✅ Pre-validation
-host_port_list = []
-errors = []
-seen_keys = set()
 
-print("\n🔎 Pre-validation Checks:")
-for i, line in enumerate(raw_input.strip().splitlines(), start=1):
-    parts = line.strip().split()
-    if len(parts) < 2:
-        errors.append(f"Line {i}: Invalid format - '{line.strip()}'")
-        continue
-
-    fqdn, port = parts[0], parts[1]
-
-    if not fqdn_pattern.match(fqdn):
-        errors.append(f"Line {i}: Invalid FQDN - '{fqdn}'")
-        continue
-
-    if not port.isdigit() or not (1 <= int(port) <= 65535):
-        errors.append(f"Line {i}: Invalid TCP port - '{port}'")
-        continue
+# 🔧 Build POOLS dictionary
+def build_pools(hostname, domain, port):
+    return create_pool_entry(hostname, domain, port, constants)
 
-    hostname = fqdn.split(".")[0].lower()
-    domain = ".".join(fqdn.split(".")[1:])
-    key = (hostname, port)
 
-    if key in seen_keys:
-        errors.append(f"Line {i}: Duplicate hostname '{hostname}' and port '{port}'")
+# ✅ Pre-validation
+def pre_validate(records, errors=None):
+    host_port_list = HostStore()
+    errors = [] if errors is None else errors
+    seen_keys = set()
+
+    for i, fqdn, port in records:
+        if port is None:
+            errors.append(f"Line {i}: Invalid format - '{fqdn}'")
+            continue
+
+        if not fqdn_pattern.match(fqdn):
+            errors.append(f"Line {i}: Invalid FQDN - '{fqdn}'")
+            continue
+
+        if not port.isdigit() or not (1 <= int(port) <= 65535):
+            errors.append(f"Line {i}: Invalid TCP port - '{port}'")
+            continue
+
+        hostname = fqdn.split(".")[0].lower()
+        domain = ".".join(fqdn.split(".")[1:])
+        key = duplicate_key(hostname, port)
+
+        if key in seen_keys:
+            errors.append(f"Line {i}: Duplicate hostname '{hostname}' and port '{port}'")
+        else:
+            seen_keys.add(key)
+            host_port_list.append(hostname, domain, port)
+
+    return host_port_list, errors
+
+
+def main():
+    # 🗃️ Create input file if missing, then stream it line by line
+    if not os.path.exists(FQDN_FILE):
+        print(f"📄 Creating {FQDN_FILE} from default raw input...")
+        with open(FQDN_FILE, "w") as f:
+            f.write(raw_input.strip())
     else:
-        seen_keys.add(key)
-        host_port_list.append((hostname, domain, port))
-
-# Show validation result
-if errors:
-    print("⚠️ Issues Found:")
-    for err in errors:
-        print(" -", err)
-else:
-    print("✅ All FQDN lines passed pre-validation.")
-
-# 🔧 Build POOLS dictionary
-def build_pools(hostname, domain, port):
-    base_name = hostname.upper()
-    pool_name = f"CUSTOMER_{base_name}_{port}"
-    escaped_fqdn = f"{hostname}" + ''.join(f"[.]{part}" for part in domain.split("."))
-
-    result = {}
-    for protocol in ["HTTPS", "HTTP"]:
-        result[f"{pool_name}_{protocol}"] = {
-            "description": f"{pool_name} {protocol} Pool Selection",
-            "excludeLog": False,
-            "localSubnets": local_subnets,
-            "poolName": pool_name,
-            "regexUrl": f"^{'https' if protocol == 'HTTPS' else 'http'}://({escaped_fqdn}):443/",
-            "urlQueryStringReplaceEncodeFull": True,
-            "urlQueryStringReplace": url_rewrites,
-            "responseHeadersUpdate": header_updates,
-            "whitelist": f"${{{whitelist}}}" if isinstance(whitelist, str) else whitelist
-        }
-    return result
-
-# 🧵 Concurrent processing if needed
-pools = {}
-if len(host_port_list) < 20:
-    for item in host_port_list:
-        pools.update(build_pools(*item))
-else:
-    with ThreadPoolExecutor() as executor:
-        results = executor.map(lambda x: build_pools(*x), host_port_list)
-        for pool_dict in results:
-            pools.update(pool_dict)
-
-# 📝 Skip JSON generation in test mode
-if TEST_MODE:
-    print("\n🧪 TEST_MODE is ON — Skipping JSON generation.")
-else:
-    output = {"POOLS": pools}
-    with open(OUTPUT_JSON, "w") as f:
-        json.dump(output, f, indent=2)
-    print(f"\n💾 JSON saved as '{OUTPUT_JSON}'.")
-
-# ✅ Post-validation if JSON was created
-if not TEST_MODE:
-    print("\n🔎 Post-validation Checks:")
-    try:
-        with open(OUTPUT_JSON, "r") as f:
-            loaded = json.load(f)
-            if "POOLS" not in loaded:
-                raise ValueError("Missing 'POOLS' key in JSON.")
-
-            total = len(loaded["POOLS"])
+        print(f"📥 Streaming FQDNs from existing {FQDN_FILE}...")
+
+    # ⏱️ Start timing in nanoseconds
+    start_ns = time.perf_counter_ns()
+    profiler = StageProfiler.from_env()
+
+    print("\n🔎 Pre-validation Checks:")
+    with profiler.stage("pre_validation"), ErrorCollector(ERROR_EXAMPLES, ERROR_DETAIL_FILE) as errors:
+        if BULK_VALIDATION:
+            host_port_list, errors = validate_file(FQDN_FILE, errors, workers=VALIDATION_WORKERS,
+                                                   bloom=BLOOM_DEDUP, mmap_threshold=MMAP_THRESHOLD)
+        else:
+            host_port_list, errors = pre_validate(read_inventory(FQDN_FILE, MMAP_THRESHOLD), errors)
+
+    # Show validation result: counts per category with the first few examples
+    if errors:
+        print(f"⚠️ Issues Found: {len(errors):,}")
+        for line in errors.summary_lines():
+            print(line)
+        if ERROR_DETAIL_FILE:
+            print(f"📄 Every issue is listed in '{ERROR_DETAIL_FILE}'.")
+    else:
+        print("✅ All FQDN lines passed pre-validation.")
+
+    # 🧵 Pick serial / threaded / process execution from a measured sample,
+    # then stream each entry to disk as soon as it is ready
+    plan = None
+    written_sha256 = None  # checked against the file by post-validation
+    if TEST_MODE:
+        print("\n🧪 TEST_MODE is ON — Skipping JSON generation.")
+    else:
+        shared_section, entry_constants = pool_constants(constants, SHARED_CONSTANTS)
+
+        if SHARDS:
+            with profiler.stage("build_serialize"):
+                manifest = write_shards(OUTPUT_JSON, host_port_list, entry_constants, SHARDS, SHARD_BY,
+                                        shared_section)
+            print(f"\n🧩 {len(manifest['shards'])} shards ({SHARD_BY}) with {manifest['entries']} entries, "
+                  f"manifest saved as '{manifest_path(OUTPUT_JSON)}'.")
+        elif INCREMENTAL:
+            stats = update_rows(host_port_list, OUTPUT_JSON, entry_constants, shared_section, profiler=profiler)
+            plan, written_sha256 = stats["plan"], stats["sha256"]
+            if stats["up_to_date"]:
+                print(f"\n♻️ '{OUTPUT_JSON}' is up to date — nothing to rebuild.")
+            else:
+                print(f"\n♻️ Incremental rebuild: {stats['built']} built, {stats['reused']} reused, "
+                      f"{stats['removed']} removed.")
+                print(f"💾 JSON saved as '{OUTPUT_JSON}'.")
+        else:
+            stats = write_rows(host_port_list, OUTPUT_JSON, entry_constants, shared_section, profiler=profiler)
+            plan, written_sha256 = stats["plan"], stats["sha256"]
+            print(f"\n💾 JSON saved as '{OUTPUT_JSON}'.")
+
+    # ✅ Post-validation if JSON was created
+    if not TEST_MODE:
+        print("\n🔎 Post-validation Checks:")
+        try:
+            with profiler.stage("post_validation"):
+                if SHARDS:
+                    # Each shard streamed and checked against its manifest sha256
+                    total = verify_shards(manifest_path(OUTPUT_JSON))
+                else:
+                    # One streaming pass: structure, entry count, regexUrl
+                    # compiles, and the file matches what was just written
+                    total = verify_output(OUTPUT_JSON, expected_sha256=written_sha256).entries
             print(f"✅ JSON structure valid. Total pool entries: {total}")
-    except Exception as e:
-        print(f"❌ Post-validation failed: {e}")
-
-# ⏱️ End time
-end_ns = time.perf_counter_ns()
-duration_ns = end_ns - start_ns
-print(f"\n🕒 Completed in {duration_ns:,} nanoseconds ({duration_ns / 1e6:.3f} ms)")
-print(f"🔢 Valid pool mappings processed: {len(host_port_list)}")
+        except Exception as e:
+            print(f"❌ Post-validation failed: {e}")
+
+    # ⏱️ End time
+    end_ns = time.perf_counter_ns()
+    duration_ns = end_ns - start_ns
+    print(f"\n🕒 Completed in {duration_ns:,} nanoseconds ({duration_ns / 1e6:.3f} ms)")
+    print(f"🔢 Valid pool mappings processed: {len(host_port_list)}")
+    if plan:
+        print(f"⚙️ Executor: {describe_plan(plan)}")
+
+    # 🔬 Per-stage report when POOLGEN_PROFILE is set
+    if profiler.enabled:
+        print("\n🔬 Stage profile:")
+        for line in profiler.summary_lines():
+            print(line)
+        print(f"📄 Profile report saved as '{profiler.export(OUTPUT_JSON)}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# 🗂️ Incremental regeneration cache for pools_output.json
+#
+# Each valid inventory row is keyed by a digest of its (hostname, domain, port)
+# plus the constants block. The cache file next to the output maps every
+# digest to the byte span of that row's entries in the current output, so a
+# rebuild only generates new or changed rows and copies everything else
+# straight out of the previous file. Removed rows simply are not copied.
+# The new file is written beside the old one and swapped in with os.replace.
+import hashlib
+import json
+import os
+
+from pool_writer import PoolJsonWriter
+
+CACHE_VERSION = 1
+ENTRIES_PER_ROW = 2  # HTTPS + HTTP
+
+
+def constants_digest(constants, shared_section=None):
+    blob = json.dumps([constants, shared_section], sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def row_digest(hostname, domain, port, cdigest):
+    blob = f"{hostname}\t{domain}\t{port}\t{cdigest}".encode()
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
+
+
+class BuildCache:
+    def __init__(self, output_path, constants, shared_section=None, cache_path=None):
+        self.output_path = output_path
+        self.cache_path = cache_path or f"{output_path}.cache"
+        self.shared_section = shared_section
+        self.cdigest = constants_digest(constants, shared_section)
+        self.rows = self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = json.load(f)
+            stat = os.stat(self.output_path)
+        except (OSError, ValueError):
+            return {}
+        if (cache.get("version") != CACHE_VERSION
+                or cache.get("constants") != self.cdigest
+                or cache.get("output_size") != stat.st_size
+                or cache.get("output_mtime_ns") != stat.st_mtime_ns):
+            return {}
+        return cache["rows"]
+
+    def diff(self, host_port_list):
+        # Returns (digests for every row, rows that must be built, up_to_date)
+        digests = [row_digest(h, d, p, self.cdigest) for h, d, p in host_port_list]
+        missing = [row for row, digest in zip(host_port_list, digests) if digest not in self.rows]
+        up_to_date = not missing and len(digests) == len(self.rows) and list(self.rows) == digests
+        return digests, missing, up_to_date
+
+    def write(self, digests, built_fragments):
+        # `built_fragments` yields the encoded entries of the missing rows, in
+        # order. Returns {"reused": n, "built": n, "removed": n, "sha256": hex}.
+        built = iter(built_fragments)
+        new_rows = {}
+        reused = 0
+        tmp_path = f"{self.output_path}.tmp"
+
+        old = open(self.output_path, "rb") if self.rows else None
+        try:
+            with PoolJsonWriter(tmp_path, constants=self.shared_section, atomic=False) as writer:
+                for digest in digests:
+                    span = self.rows.get(digest)
+                    if span is not None:
+                        old.seek(span[0])
+                        text = old.read(span[1]).decode("ascii").replace(os.linesep, "\n")
+                        reused += 1
+                    else:
+                        text = ",\n    ".join(next(built) for _ in range(ENTRIES_PER_ROW))
+                    start = writer.write_encoded(text, entries=ENTRIES_PER_ROW)
+                    new_rows[digest] = [start, writer.offset - start]
+        finally:
+            if old:
+                old.close()
+
+        os.replace(tmp_path, self.output_path)
+        stat = os.stat(self.output_path)
+        cache = {
+            "version": CACHE_VERSION,
+            "constants": self.cdigest,
+            "output_size": stat.st_size,
+            "output_mtime_ns": stat.st_mtime_ns,
+            "rows": new_rows,
+        }
+        with open(f"{self.cache_path}.tmp", "w") as f:
+            json.dump(cache, f)
+        os.replace(f"{self.cache_path}.tmp", self.cache_path)
+
+        removed = len(set(self.rows) - new_rows.keys())
+        self.rows = new_rows
+        return {"reused": reused, "built": len(digests) - reused, "removed": removed, "sha256": writer.sha256}
@@ -0,0 +1,180 @@
+# 🩹 Minimal-diff deploy: JSON Patch between two pools documents
+#
+# Usage: python pool_diff.py OLD.json NEW.json [-o patch.json]
+#
+# Produces an RFC 6902 patch that turns the old {"POOLS": ...} document into
+# the new one, so the proxy can apply a handful of operations instead of
+# reloading every pool:
+#   - pools only in the old document:  {"op": "remove", "path": "/POOLS/<key>"}
+#   - pools only in the new document:  {"op": "add", ..., "value": <config>}
+#   - pools that differ: one op per changed field ("/POOLS/<key>/<field>"),
+#     or a whole-entry replace if either config is not an object
+# Other top-level keys (CONSTANTS) are compared and replaced whole.
+#
+# The old file is streamed with pool_verify's reader, so the UTF-8 BOM and
+# the member order of js6.ps1's ConvertTo-Json output make no difference;
+# values are compared, never formatting. Both sides are indexed by pool key,
+# so the work is linear in the number of pools:
+#   - diff_pools() takes the new pools as a dict (what poolgen.generate()
+#     returns) and compares each streamed old config with new[key]
+#   - diff_files() indexes the old file by a digest of each entry's source
+#     text, streams the new file against it, and parses only the entries
+#     whose text differs a second time to compare them by value; two files
+#     from the same writer therefore cost one hash per unchanged entry and
+#     one read of each file
+import argparse
+import hashlib
+import json
+import sys
+
+from pool_verify import iter_document
+
+DIGEST_BYTES = 16
+_MISSING = object()
+
+
+def text_digest(text):
+    return hashlib.blake2b(text.encode(), digest_size=DIGEST_BYTES).digest()
+
+
+def pointer(*tokens):
+    # RFC 6901 JSON Pointer from unescaped reference tokens
+    return "".join("/" + token.replace("~", "~0").replace("/", "~1") for token in tokens)
+
+
+def entry_ops(pool_key, old, new):
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return [{"op": "replace", "path": pointer("POOLS", pool_key), "value": new}]
+    ops = [{"op": "remove", "path": pointer("POOLS", pool_key, field)} for field in old if field not in new]
+    for field, value in new.items():
+        if field not in old:
+            ops.append({"op": "add", "path": pointer("POOLS", pool_key, field), "value": value})
+        elif old[field] != value:
+            ops.append({"op": "replace", "path": pointer("POOLS", pool_key, field), "value": value})
+    return ops
+
+
+def section_ops(old_sections, new_sections):
+    ops = [{"op": "remove", "path": pointer(key)} for key in old_sections if key not in new_sections]
+    for key, value in new_sections.items():
+        if key not in old_sections:
+            ops.append({"op": "add", "path": pointer(key), "value": value})
+        elif old_sections[key] != value:
+            ops.append({"op": "replace", "path": pointer(key), "value": value})
+    return ops
+
+
+def diff_pools(old_path, new_pools, new_sections=None):
+    # `new_pools` maps pool key -> config; `new_sections` holds the new
+    # document's other top-level keys. Returns the patch operations: pool
+    # removals, then changed pools (both in old-document order), then
+    # top-level keys, then added pools.
+    removed, changed = [], []
+    old_sections = {}
+    old_keys = set()
+    for section, key, old in iter_document(old_path):
+        if section is None:
+            old_sections[key] = old
+            continue
+        old_keys.add(key)
+        new = new_pools.get(key, _MISSING)
+        if new is _MISSING:
+            removed.append({"op": "remove", "path": pointer("POOLS", key)})
+        elif new != old:
+            changed.extend(entry_ops(key, old, new))
+    added = [{"op": "add", "path": pointer("POOLS", key), "value": config}
+             for key, config in new_pools.items() if key not in old_keys]
+    return removed + changed + section_ops(old_sections, new_sections or {}) + added
+
+
+def diff_files(old_path, new_path):
+    # The same operations as diff_pools() on the parsed new document
+    old_index = {}  # pool key -> digest of its source text, None once seen in the new file
+    old_sections = {}
+    for section, key, (value, text) in iter_document(old_path, with_text=True):
+        if section == "POOLS":
+            old_index[key] = text_digest(text)
+        else:
+            old_sections[key] = value
+
+    new_sections = {}
+    suspect = {}  # pool key -> new config whose text differs from the old one
+    added = []
+    for section, key, (value, text) in iter_document(new_path, with_text=True):
+        if section is None:
+            new_sections[key] = value
+            continue
+        digest = old_index.get(key, _MISSING)
+        if digest is _MISSING:
+            added.append({"op": "add", "path": pointer("POOLS", key), "value": value})
+            continue
+        if digest is not None and digest != text_digest(text):
+            suspect[key] = value
+        old_index[key] = None
+
+    removed = [{"op": "remove", "path": pointer("POOLS", key)}
+               for key, digest in old_index.items() if digest is not None]
+    changed = []
+    if suspect:
+        # Second read of the old file, for the entries whose text changed
+        for section, key, old in iter_document(old_path):
+            if section == "POOLS" and key in suspect and suspect[key] != old:
+                changed.extend(entry_ops(key, old, suspect[key]))
+    return removed + changed + section_ops(old_sections, new_sections) + added
+
+
+def apply_patch(document, ops):
+    # Applies add/remove/replace operations on object members in place, as a
+    # proxy would; enough to check a patch produced by diff_pools()
+    for op in ops:
+        tokens = [token.replace("~1", "/").replace("~0", "~") for token in op["path"].split("/")[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[token]
+        if op["op"] == "remove":
+            del parent[tokens[-1]]
+        elif op["op"] == "add" or tokens[-1] in parent:
+            parent[tokens[-1]] = op["value"]
+        else:
+            raise ValueError(f"Cannot replace missing member {op['path']}.")
+    return document
+
+
+def write_patch(path, ops):
+    # One operation per line, so large patches stay diffable themselves
+    with open(path, "w") as f:
+        f.write("[\n" if ops else "[]\n")
+        for i, op in enumerate(ops):
+            f.write(f"  {json.dumps(op)}{',' if i < len(ops) - 1 else ''}\n")
+        if ops:
+            f.write("]\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSON Patch (RFC 6902) between two pools documents")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("-o", "--output", default=None, help="write the patch here instead of stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        ops = diff_files(args.old, args.new)
+    except (OSError, ValueError) as e:
+        print(f"❌ Diff failed: {e}", file=sys.stderr)
+        return 1
+
+    counts = {}
+    for op in ops:
+        counts[op["op"]] = counts.get(op["op"], 0) + 1
+    if args.output:
+        write_patch(args.output, ops)
+        summary = ", ".join(f"{count:,} {name}" for name, count in counts.items()) or "no changes"
+        print(f"🩹 {len(ops):,} operations ({summary}) saved as '{args.output}'.")
+    else:
+        json.dump(ops, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
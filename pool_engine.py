@@ -0,0 +1,318 @@
+# ⚙️ Multi-core pool generation engine
+#
+# Everything a worker process needs lives at module level here, so it can be
+# pickled by reference and imported under the "spawn" start method without
+# re-running any script's top-level validation. Scripts that use the process
+# path must still keep their own work behind `if __name__ == "__main__":`.
+import functools
+import itertools
+import multiprocessing
+import os
+import pickle
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from json.encoder import encode_basestring_ascii
+
+from pool_writer import encode_entry
+
+DEFAULT_CHUNK_SIZE = 2000
+PROTOCOLS = (("HTTPS", "https"), ("HTTP", "http"))
+
+
+def make_constants(local_subnets, url_rewrites, header_updates, whitelist):
+    return {
+        "localSubnets": local_subnets,
+        "urlQueryStringReplace": url_rewrites,
+        "responseHeadersUpdate": header_updates,
+        "whitelist": f"${{{whitelist}}}" if isinstance(whitelist, str) else whitelist,
+    }
+
+
+# 📦 Shared-constant output: repeated blocks go to a top-level CONSTANTS section
+# once and every pool refers to them as "${CONSTANTS:<name>}"
+SHARED_CONSTANT_NAMES = {
+    "localSubnets": "pool_local_subnets",
+    "urlQueryStringReplace": "pool_url_rewrites",
+    "responseHeadersUpdate": "pool_header_updates",
+    "whitelist": "pool_whitelist",
+}
+
+
+def hoist_constants(constants, names=SHARED_CONSTANT_NAMES):
+    section = {}
+    referenced = dict(constants)
+    for field, name in names.items():
+        value = constants[field]
+        if isinstance(value, str):
+            continue  # already a ${CONSTANTS:...} reference
+        section[name] = value
+        referenced[field] = f"${{CONSTANTS:{name}}}"
+    return section, referenced
+
+
+def _pool_config(description, pool_name, regex_url, constants):
+    return {
+        "description": description,
+        "excludeLog": False,
+        "localSubnets": constants["localSubnets"],
+        "poolName": pool_name,
+        "regexUrl": regex_url,
+        "urlQueryStringReplaceEncodeFull": True,
+        "urlQueryStringReplace": constants["urlQueryStringReplace"],
+        "responseHeadersUpdate": constants["responseHeadersUpdate"],
+        "whitelist": constants["whitelist"],
+    }
+
+
+def create_pool_entry(hostname, domain, port, constants):
+    base_name = hostname.upper()
+    pool_name = f"CUSTOMER_{base_name}_{port}"
+    escaped_fqdn = f"{hostname}[.]{domain.replace('.', '[.]')}"
+
+    result = {}
+    for protocol, scheme in PROTOCOLS:
+        result[f"{pool_name}_{protocol}"] = _pool_config(f"{pool_name} {protocol} Pool Selection", pool_name,
+                                                         f"^{scheme}://({escaped_fqdn}):443/", constants)
+    return result
+
+
+# 🧩 Precompiled entry templates
+#
+# Everything in an encoded entry except its key, description, poolName and
+# regexUrl depends only on the constants, so the entry is encoded once with
+# marker strings in those four places and split around them. Rendering a row
+# is then four C-level string escapes spliced between fixed pieces instead of
+# building two 9-key dicts and re-serializing every constant list. A compiled
+# template checks itself against the dict path on a probe row and is only
+# used if the two are byte-identical.
+TEMPLATE_MARKS = ("\x00key\x00", "\x00description\x00", "\x00poolName\x00", "\x00regexUrl\x00")
+PROBE_ROW = ("probe-host", "glb.example.com", "0443")
+
+
+class EntryTemplate:
+    def __init__(self, constants):
+        marked = encode_entry(TEMPLATE_MARKS[0], _pool_config(*TEMPLATE_MARKS[1:], constants))
+        pieces = [marked]
+        for mark in TEMPLATE_MARKS:
+            head, found, tail = pieces.pop().partition(encode_basestring_ascii(mark))
+            if not found or encode_basestring_ascii(mark) in head:
+                raise ValueError("constants collide with the entry template markers")
+            pieces += [head, tail]
+        self.pieces = tuple(pieces)  # 5 fixed pieces around the 4 fields
+        self.verified = self.encode_row(*PROBE_ROW) == _encode_row_dicts(*PROBE_ROW, constants)
+
+    def encode_row(self, hostname, domain, port):
+        # The row's encoded entries, identical to encode_entry() over
+        # create_pool_entry(hostname, domain, port, constants)
+        p0, p1, p2, p3, p4 = self.pieces
+        pool_name = f"CUSTOMER_{hostname.upper()}_{port}"
+        escaped_fqdn = f"{hostname}[.]{domain.replace('.', '[.]')}"
+        name = encode_basestring_ascii(pool_name)
+        return [
+            f"{p0}{encode_basestring_ascii(f'{pool_name}_{protocol}')}{p1}"
+            f"{encode_basestring_ascii(f'{pool_name} {protocol} Pool Selection')}{p2}{name}{p3}"
+            f"{encode_basestring_ascii(f'^{scheme}://({escaped_fqdn}):443/')}{p4}"
+            for protocol, scheme in PROTOCOLS
+        ]
+
+
+def _encode_row_dicts(hostname, domain, port, constants):
+    return [encode_entry(pool_key, pool_config)
+            for pool_key, pool_config in create_pool_entry(hostname, domain, port, constants).items()]
+
+
+_templates = {}  # id(constants) -> (constants, EntryTemplate or None if unusable)
+
+
+def compiled_template(constants):
+    # The verified template for `constants`, or None when they must take the
+    # dict path; either way it is decided once per constants object
+    cached = _templates.get(id(constants))
+    if cached is not None and cached[0] is constants:
+        return cached[1]
+    try:
+        template = EntryTemplate(constants)
+    except ValueError:
+        template = None
+    if template is not None and not template.verified:
+        template = None
+    if len(_templates) > 64:
+        _templates.clear()
+    _templates[id(constants)] = (constants, template)  # holding constants keeps its id unique
+    return template
+
+
+# 🧵 Worker side: constants are shipped once per process, chunks carry only tuples
+_worker_constants = None
+
+
+def _init_worker(constants):
+    global _worker_constants
+    _worker_constants = constants
+
+
+def build_chunk(chunk, constants=None):
+    constants = constants if constants is not None else _worker_constants
+    pools = {}
+    for hostname, domain, port in chunk:
+        pools.update(create_pool_entry(hostname, domain, port, constants))
+    return pools
+
+
+def encode_chunk(chunk, constants=None):
+    constants = constants if constants is not None else _worker_constants
+    template = compiled_template(constants)
+    if template is None:
+        return encode_chunk_dicts(chunk, constants)
+    fragments = []
+    for hostname, domain, port in chunk:
+        fragments += template.encode_row(hostname, domain, port)
+    return fragments
+
+
+def encode_chunk_dicts(chunk, constants=None):
+    # The reference path: build the pools dict, then encode every entry
+    pools = build_chunk(chunk, constants)
+    return [encode_entry(pool_key, pool_config) for pool_key, pool_config in pools.items()]
+
+
+def iter_chunks(items, chunk_size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _ordered_results(executor, fn, chunks, window):
+    # Keep at most `window` chunks in flight so results never pile up in memory
+    # faster than the caller consumes them.
+    pending = []
+    for chunk in chunks:
+        pending.append(executor.submit(fn, chunk))
+        if len(pending) >= window:
+            yield pending.pop(0).result()
+    for future in pending:
+        yield future.result()
+
+
+def generate_chunks(host_port_list, constants, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, encoded=False):
+    # Yields one result per chunk, in input order: a pools dict, or a list of
+    # encoded entry fragments for PoolJsonWriter.write_encoded when `encoded`.
+    fn = encode_chunk if encoded else build_chunk
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(constants,)) as executor:
+        yield from _ordered_results(executor, fn, iter_chunks(host_port_list, chunk_size), workers * 2)
+
+
+def generate_serial(host_port_list, constants, encoded=False):
+    fn = encode_chunk if encoded else build_chunk
+    for chunk in iter_chunks(host_port_list, DEFAULT_CHUNK_SIZE):
+        yield fn(chunk, constants)
+
+
+# 📏 Self-calibrating executor selection
+#
+# A small sample is built (and encoded) serially to measure the cost per
+# input row (its HTTPS and HTTP entries together, the unit chunks are cut in),
+# the same sample is pickled round-trip to price the IPC, and a two-thread run
+# shows whether threads get any real parallelism under the GIL. The cheapest
+# estimated mode for the whole input wins. An input no bigger than the sample,
+# or a single worker, can only run serially, so nothing is measured then.
+CALIBRATION_SAMPLE = 256
+TARGET_CHUNK_NS = 50_000_000  # aim for ~50 ms of worker time per chunk
+MIN_CHUNK_SIZE = 100
+MAX_CHUNK_SIZE = 20_000
+PROCESS_STARTUP_NS = {"fork": 10_000_000, "forkserver": 60_000_000, "spawn": 120_000_000}
+THREAD_STARTUP_NS = 200_000
+THREAD_MIN_SPEEDUP = 1.2  # below this a two-thread sample is timing noise, not parallelism
+
+ExecutionPlan = namedtuple(
+    "ExecutionPlan",
+    "mode workers chunk_size sample_size per_row_ns ipc_ns thread_speedup estimates_ns",
+)
+
+
+def _time_ns(fn, *args):
+    start = time.perf_counter_ns()
+    fn(*args)
+    return time.perf_counter_ns() - start
+
+
+def _thread_speedup(sample, constants):
+    half = len(sample) // 2
+    if half < 8:
+        return 1.0
+    chunks = [sample[:half], sample[half:2 * half]]
+    serial_ns = sum(_time_ns(encode_chunk, chunk, constants) for chunk in chunks)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        start = time.perf_counter_ns()
+        list(executor.map(encode_chunk, chunks, [constants, constants]))
+        threaded_ns = time.perf_counter_ns() - start
+    return serial_ns / max(threaded_ns, 1)
+
+
+def calibrate(host_port_list, constants, workers=None, sample_size=CALIBRATION_SAMPLE):
+    n = len(host_port_list)
+    workers = workers or os.cpu_count() or 1
+    if n <= sample_size or workers == 1:
+        return ExecutionPlan("serial", 1, DEFAULT_CHUNK_SIZE, 0, 0, 0, 1.0, {})
+    sample = list(itertools.islice(host_port_list, sample_size))
+
+    encode_chunk(sample[:8], constants)  # warm up caches before timing
+    start = time.perf_counter_ns()
+    fragments = encode_chunk(sample, constants)
+    per_row_ns = (time.perf_counter_ns() - start) / len(sample)
+
+    start = time.perf_counter_ns()
+    pickle.loads(pickle.dumps(sample))
+    pickle.loads(pickle.dumps(fragments))
+    ipc_ns = (time.perf_counter_ns() - start) / len(sample)
+
+    thread_speedup = _thread_speedup(sample, constants)
+
+    estimates = {"serial": n * per_row_ns}
+    if workers > 1:
+        effective = min(thread_speedup, workers) if thread_speedup >= THREAD_MIN_SPEEDUP else 1.0
+        estimates["threaded"] = THREAD_STARTUP_NS * workers + n * per_row_ns / effective
+        startup_ns = PROCESS_STARTUP_NS.get(multiprocessing.get_start_method(), PROCESS_STARTUP_NS["spawn"])
+        estimates["process"] = startup_ns * workers + n * (per_row_ns / workers + ipc_ns)
+    mode = min(estimates, key=estimates.get)
+
+    chunk_size = int(TARGET_CHUNK_NS / max(per_row_ns, 1))
+    if mode != "serial":
+        # At least four chunks per worker so a slow chunk cannot stall the tail
+        chunk_size = min(chunk_size, -(-n // (workers * 4)))
+    chunk_size = max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, chunk_size))
+
+    return ExecutionPlan(mode, workers if mode != "serial" else 1, chunk_size, len(sample),
+                         per_row_ns, ipc_ns, thread_speedup, estimates)
+
+
+def describe_plan(plan):
+    if not plan.sample_size:
+        return f"{plan.mode} ({plan.workers} worker(s), chunk size {plan.chunk_size:,}) — not calibrated"
+    basis = (f"measured {plan.per_row_ns / 1e3:.1f} µs/row build, {plan.ipc_ns / 1e3:.1f} µs/row IPC, "
+             f"{plan.thread_speedup:.2f}x thread speedup on a {plan.sample_size}-row sample")
+    estimates = ", ".join(f"{mode} ~{ns / 1e6:,.1f} ms" for mode, ns in plan.estimates_ns.items())
+    return (f"{plan.mode} ({plan.workers} worker(s), chunk size {plan.chunk_size:,}) — "
+            f"{basis}; estimates: {estimates}")
+
+
+def run_plan(plan, host_port_list, constants):
+    # Yields lists of encoded entry fragments, in input order.
+    if plan.mode == "process":
+        yield from generate_chunks(host_port_list, constants, workers=plan.workers,
+                                   chunk_size=plan.chunk_size, encoded=True)
+    elif plan.mode == "threaded":
+        with ThreadPoolExecutor(max_workers=plan.workers) as executor:
+            yield from _ordered_results(executor, functools.partial(encode_chunk, constants=constants),
+                                        iter_chunks(host_port_list, plan.chunk_size), plan.workers * 2)
+    else:
+        for chunk in iter_chunks(host_port_list, plan.chunk_size):
+            yield encode_chunk(chunk, constants)
@@ -0,0 +1,109 @@
+# 🧭 Overlap and shadowing analysis for regexUrl across all pools
+#
+# Usage: python pool_overlap.py [pools_output.json] [--examples 10]
+#
+# The proxy walks POOLS in order and takes the first regexUrl that matches,
+# so two pools that match the same URLs are not an error anywhere, one of
+# them just never gets traffic. Generated patterns are literal,
+# ^<scheme>://(<host>):<port>/, and such a pattern matches exactly the URLs
+# starting with "<scheme>://<host>:<port>/". Two literal patterns therefore
+# overlap only if those prefixes are equal, so they are grouped in a hash
+# index on (scheme, host, port) in one pass: every pool after the first in a
+# group is shadowed. Hostnames that repeat across ports (the same host at
+# 15515 and 17515) land in the same group, because the pool port is not part
+# of the URL.
+#
+# Any other pattern is compiled and tried against the bare prefix URL of each
+# literal group, so the cost is linear in the literal pools plus (opaque x
+# groups) for the rare hand-written regex, never a pairwise regex comparison.
+# That catches hand-written patterns that take a literal pool's traffic, not
+# ones that only match deeper paths, nor overlaps between two of them.
+import argparse
+import re
+import sys
+from collections import namedtuple
+
+from pool_verify import iter_document, literal_target
+
+DEFAULT_EXAMPLES = 10
+
+Shadowed = namedtuple("Shadowed", "target winner losers")  # pool keys in document order
+Overlap = namedtuple("Overlap", "pattern_pool literal_pool pattern_first")
+Analysis = namedtuple("Analysis", "pools literal opaque invalid shadowed overlaps")
+
+
+def target_url(target):
+    scheme, host, port = target
+    return f"{scheme}://{host}:{port}/"
+
+
+def analyze(entries):
+    # `entries` yields (pool key, pool config) in document order
+    first = {}  # (scheme, host, port) -> (position, pool key) of its first pool
+    losers = {}  # (scheme, host, port) -> later pool keys
+    opaque = []  # (position, pool key, compiled regexUrl)
+    invalid = []
+    pools = 0
+    for position, (pool_key, config) in enumerate(entries):
+        pools += 1
+        pattern = config.get("regexUrl") if isinstance(config, dict) else None
+        if not isinstance(pattern, str):
+            invalid.append(pool_key)
+            continue
+        target = literal_target(pattern)
+        if target is None:
+            try:
+                opaque.append((position, pool_key, re.compile(pattern)))
+            except re.error:
+                invalid.append(pool_key)
+        elif target in first:
+            losers.setdefault(target, []).append(pool_key)
+        else:
+            first[target] = (position, pool_key)
+
+    shadowed = [Shadowed(target, first[target][1], keys) for target, keys in losers.items()]
+    overlaps = []
+    for position, pool_key, regex in opaque:
+        for target, (literal_position, literal_key) in first.items():
+            if regex.match(target_url(target)):
+                overlaps.append(Overlap(pool_key, literal_key, position < literal_position))
+    return Analysis(pools, len(first) + sum(map(len, losers.values())), len(opaque), invalid, shadowed, overlaps)
+
+
+def analyze_file(path):
+    return analyze((key, config) for section, key, config in iter_document(path) if section == "POOLS")
+
+
+def report_lines(analysis, examples=DEFAULT_EXAMPLES):
+    yield (f"{analysis.pools:,} pools: {analysis.literal:,} literal regexUrl, {analysis.opaque:,} other, "
+           f"{len(analysis.invalid):,} missing or invalid")
+    lost = sum(len(group.losers) for group in analysis.shadowed)
+    yield f"Shadowed: {lost:,} pools in {len(analysis.shadowed):,} groups with an identical regexUrl target"
+    for group in analysis.shadowed[:examples]:
+        yield f"    {target_url(group.target)} → {group.winner} wins over {', '.join(group.losers)}"
+    yield f"Overlapping: {len(analysis.overlaps):,} hand-written regexUrl / literal pool pairs"
+    for overlap in analysis.overlaps[:examples]:
+        order = "shadows" if overlap.pattern_first else "is shadowed by"
+        yield f"    {overlap.pattern_pool} {order} {overlap.literal_pool} (both match its prefix URL)"
+    if analysis.invalid:
+        yield f"Missing or invalid regexUrl: {', '.join(analysis.invalid[:examples])}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report pools whose regexUrl overlaps or shadows another")
+    parser.add_argument("path", nargs="?", default="pools_output.json")
+    parser.add_argument("--examples", type=int, default=DEFAULT_EXAMPLES, help="examples printed per finding")
+    args = parser.parse_args(argv)
+
+    try:
+        analysis = analyze_file(args.path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Analysis failed: {e}", file=sys.stderr)
+        return 1
+    for line in report_lines(analysis, args.examples):
+        print(line)
+    return 1 if analysis.shadowed or analysis.overlaps else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+# 🔬 Opt-in per-stage profiling and memory instrumentation
+#
+# Turned on from the environment, so a run can be profiled without editing
+# the script:
+#   POOLGEN_PROFILE=1               record wall/CPU time and memory per stage
+#   POOLGEN_PROFILE_STAGE=<name>    also run cProfile on that stage
+#   POOLGEN_TRACEMALLOC=0           skip tracemalloc (it slows allocation-heavy stages)
+#
+# The report lands next to the output file: <output>.profile.json, plus
+# <output>.<stage>.prof (pstats) and <output>.<stage>.folded (collapsed stacks
+# for flamegraph.pl / speedscope) for the cProfile'd stage.
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+MAX_FOLD_DEPTH = 64
+
+
+class StageProfiler:
+    def __init__(self, enabled=False, profile_stage=None, trace_memory=True):
+        self.enabled = enabled
+        self.profile_stage = profile_stage
+        self.trace_memory = trace_memory
+        self.stages = []
+        self._profile = None
+
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        return cls(
+            enabled=environ.get("POOLGEN_PROFILE", "") not in ("", "0"),
+            profile_stage=environ.get("POOLGEN_PROFILE_STAGE") or None,
+            trace_memory=environ.get("POOLGEN_TRACEMALLOC", "1") != "0",
+        )
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+
+        profile = None
+        if name == self.profile_stage:
+            import cProfile
+            profile = cProfile.Profile()
+
+        blocks_before = sys.getallocatedblocks()
+        wall_start = time.perf_counter_ns()
+        cpu_start = time.process_time_ns()
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+                self._profile = profile
+            record = {
+                "stage": name,
+                "wall_ns": time.perf_counter_ns() - wall_start,
+                "cpu_ns": time.process_time_ns() - cpu_start,
+                "allocated_blocks_delta": sys.getallocatedblocks() - blocks_before,
+            }
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record["tracemalloc_peak_bytes"] = peak - traced_before
+                record["tracemalloc_retained_bytes"] = current - traced_before
+                if started_tracing:
+                    tracemalloc.stop()
+            self.stages.append(record)
+
+    def export(self, output_path):
+        if not self.enabled:
+            return None
+        report_path = f"{output_path}.profile.json"
+        report = {"stages": self.stages, "profiled_stage": None}
+
+        if self._profile:
+            import pstats
+            stats = pstats.Stats(self._profile)
+            prof_path = f"{output_path}.{self.profile_stage}.prof"
+            folded_path = f"{output_path}.{self.profile_stage}.folded"
+            stats.dump_stats(prof_path)
+            with open(folded_path, "w") as f:
+                for stack, micros in fold_stacks(stats):
+                    f.write(f"{stack} {micros}\n")
+            report["profiled_stage"] = {"name": self.profile_stage, "pstats": prof_path, "folded": folded_path}
+
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2)
+        return report_path
+
+    def summary_lines(self):
+        for r in self.stages:
+            memory = ""
+            if "tracemalloc_peak_bytes" in r:
+                memory = f", peak {r['tracemalloc_peak_bytes'] / 1e6:,.2f} MB"
+            yield (f"{r['stage']}: wall {r['wall_ns'] / 1e6:,.3f} ms, cpu {r['cpu_ns'] / 1e6:,.3f} ms"
+                   f"{memory}, blocks {r['allocated_blocks_delta']:+,}")
+
+
+def _label(func):
+    filename, line, name = func
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def fold_stacks(stats):
+    # cProfile only keeps caller -> callee edges, so full stacks are rebuilt by
+    # walking down from the roots and splitting each function's time across
+    # its callers in proportion to the cumulative time they account for.
+    raw = stats.stats  # func -> (cc, nc, tottime, cumtime, callers)
+    callees = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, (_, _, _, caller_cum) in callers.items():
+            callees.setdefault(caller, []).append((func, caller_cum))
+
+    folded = {}
+
+    def walk(func, share, path):
+        _, _, tottime, cumtime, _ = raw[func]
+        stack = path + [_label(func)]
+        key = ";".join(stack)
+        folded[key] = folded.get(key, 0) + tottime * share
+        if len(stack) >= MAX_FOLD_DEPTH:
+            return
+        for callee, edge_cum in callees.get(func, ()):
+            if callee in raw and _label(callee) not in path and cumtime:
+                walk(callee, share * edge_cum / raw[callee][3] if raw[callee][3] else 0, stack)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, 1.0, [])
+
+    return [(stack, int(seconds * 1e6)) for stack, seconds in folded.items() if seconds * 1e6 >= 1]
@@ -0,0 +1,161 @@
+# 🔁 Single-pass engine for a pool's urlQueryStringReplace rewrites
+#
+# A pool's urlQueryStringReplace is an ordered list of {"regex", "replace"}
+# rules for the URL's query string; applied naively that is one re.sub per
+# rule per URL. compile_rules() turns a list into a RuleSet once:
+#   - when every regex is a plain literal (such as 100[.]116[.]123[.]240)
+#     and every replacement is plain text, the rules become one alternation
+#     pattern plus a literal -> replacement dispatch table, applied in a
+#     single scan of the query string. That is only done when the single
+#     scan provably gives the sequential result: no literal overlaps
+#     another, and no replacement can create or complete a later rule's
+#     literal (checked when the set is compiled)
+#   - any other list keeps one compiled pattern per rule, applied in order
+# Compiled sets are cached by the rules' content (a hashed tuple of the
+# pairs), so the thousands of pools that carry the same list, each parsed
+# into its own list object, share one RuleSet.
+#
+# With urlQueryStringReplaceEncodeFull the query string is split on "&" and
+# "=" first, and the rules see each parameter name and value decoded
+# ("+" as a space); a name or value a rule changed is percent-encoded again
+# in full, every other one keeps its original bytes, so encoded separators
+# (%26, %3D) stay encoded. Without it the rules see and return the raw query.
+# A URL no rule matches is returned unchanged either way.
+import functools
+import re
+from urllib.parse import quote_plus, unquote_plus
+
+CACHE_SIZE = 1024  # distinct rule lists kept compiled
+_SPECIAL = set(".^$*+?{}[]\\|()")
+
+
+def regex_literal(pattern):
+    # The text `pattern` matches if it is a plain literal ("a[.]b", "a\.b"),
+    # else None
+    chars = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "[" and i + 2 < len(pattern) and pattern[i + 2] == "]" and pattern[i + 1] not in "^\\]":
+            chars.append(pattern[i + 1])
+            i += 3
+        elif char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            chars.append(pattern[i + 1])
+            i += 2
+        elif char in _SPECIAL:
+            return None
+        else:
+            chars.append(char)
+            i += 1
+    return "".join(chars) or None
+
+
+def _overlaps(a, b):
+    # True if some non-empty suffix of `a` is a prefix of `b`
+    return any(b.startswith(a[-n:]) for n in range(1, min(len(a), len(b)) + 1))
+
+
+def _single_pass_safe(literals, replacements):
+    for i, a in enumerate(literals):
+        for j, b in enumerate(literals):
+            if i != j and (a in b or _overlaps(a, b)):
+                return False
+        for b in literals[i + 1:]:
+            # An earlier replacement must not contain, straddle or complete
+            # a later literal; an empty one could join its neighbours into one
+            r = replacements[i]
+            if not r or b in r or r in b or _overlaps(r, b) or _overlaps(b, r):
+                return False
+    return True
+
+
+class RuleSet:
+    def __init__(self, rules):
+        self.rules = [(rule["regex"], rule["replace"]) for rule in rules]
+        literals = [regex_literal(pattern) for pattern, _ in self.rules]
+        replacements = [replace for _, replace in self.rules]
+        self.single_pass = (
+            bool(self.rules)
+            and None not in literals
+            and not any("\\" in replace for replace in replacements)
+            and _single_pass_safe(literals, replacements)
+        )
+        if self.single_pass:
+            self.dispatch = dict(zip(literals, replacements))
+            self.pattern = re.compile("|".join(map(re.escape, literals)))
+            self._replace = functools.partial(self.pattern.sub, self._dispatch)
+        else:
+            self.compiled = [(re.compile(pattern), replace) for pattern, replace in self.rules]
+            self._replace = self._sequential
+
+    def _dispatch(self, match):
+        return self.dispatch[match.group()]
+
+    def _sequential(self, text):
+        for regex, replace in self.compiled:
+            text = regex.sub(replace, text)
+        return text
+
+    def apply(self, text):
+        return self._replace(text)
+
+    def rewrite_url(self, url, encode_full=False):
+        # Rewrites the query string of `url`; the rest is left alone
+        base, sep, query = url.partition("?")
+        if not sep:
+            return url
+        fragment = ""
+        if "#" in query:
+            query, hash_sign, fragment = query.partition("#")
+            fragment = hash_sign + fragment
+        if encode_full:
+            if self.single_pass and not self.pattern.search(unquote_plus(query)):
+                return url  # a literal inside any one field is also in the whole
+            fields = []
+            for field in query.split("&"):
+                name, eq, value = field.partition("=")
+                fields.append(self._rewrite_field(name) + eq + (self._rewrite_field(value) if eq else ""))
+            rewritten = "&".join(fields)
+        else:
+            rewritten = self.apply(query)
+        return url if rewritten == query else f"{base}?{rewritten}{fragment}"
+
+    def _rewrite_field(self, raw):
+        decoded = unquote_plus(raw)
+        rewritten = self.apply(decoded)
+        return raw if rewritten == decoded else quote_plus(rewritten, safe="")
+
+
+def rules_key(rules):
+    # Content key of a rule list: equal lists share one RuleSet
+    return tuple((rule["regex"], rule["replace"]) for rule in rules)
+
+
+_rule_sets = {}  # rules_key() -> RuleSet
+
+
+def compile_rules(rules):
+    # The shared RuleSet for a urlQueryStringReplace list
+    key = rules_key(rules)
+    rule_set = _rule_sets.get(key)
+    if rule_set is None:
+        if len(_rule_sets) >= CACHE_SIZE:
+            _rule_sets.clear()
+        rule_set = _rule_sets[key] = RuleSet(rules)
+    return rule_set
+
+
+def pool_rules(pool_config, constants=None):
+    # (RuleSet or None, encode_full) for a pool config. A "${CONSTANTS:name}"
+    # reference (shared-constant output) is looked up in `constants`.
+    rules = pool_config.get("urlQueryStringReplace")
+    if isinstance(rules, str) and rules.startswith("${CONSTANTS:"):
+        rules = (constants or {}).get(rules[len("${CONSTANTS:"):-1])
+    encode_full = bool(pool_config.get("urlQueryStringReplaceEncodeFull", False))
+    return (compile_rules(rules) if rules else None), encode_full
+
+
+def rewrite_url(pool_config, url, constants=None):
+    # Applies a pool's urlQueryStringReplace to `url`
+    rule_set, encode_full = pool_rules(pool_config, constants)
+    return rule_set.rewrite_url(url, encode_full) if rule_set else url
@@ -0,0 +1,96 @@
+# 🚦 In-process pool router: which pool would the proxy pick for a URL?
+#
+# Usage: python pool_router.py [pools_output.json] URL [URL ...]
+#
+# The proxy tries POOLS in document order and takes the first regexUrl that
+# matches. PoolRouter gives the same answer without a regex scan: a literal
+# pattern ^<scheme>://(<host>):<port>/ matches exactly the URLs that start
+# with "<scheme>://<host>:<port>/", so literal pools go into a dict keyed by
+# (scheme, host, port), first pool per key. A lookup splits that prefix off
+# the URL and does one dict probe. Only the hand-written patterns are
+# compiled, and only the ones that come before the literal candidate are
+# tried, in document order, so first-match semantics hold exactly.
+import re
+import sys
+from collections import namedtuple
+
+from pool_verify import iter_document, literal_target
+
+SCHEMES = ("https", "http")
+
+RouterStats = namedtuple("RouterStats", "pools literal opaque unroutable")
+
+
+def split_target(url):
+    # (scheme, host, port) if the URL starts with "<scheme>://<host>:<port>/"
+    scheme, sep, rest = url.partition("://")
+    if not sep or scheme not in SCHEMES:
+        return None
+    authority, slash, _ = rest.partition("/")
+    host, colon, port = authority.rpartition(":")
+    if not slash or not colon:
+        return None
+    return scheme, host, port
+
+
+class PoolRouter:
+    def __init__(self, entries):
+        # `entries` yields (pool key, pool config) in document order
+        self.index = {}  # (scheme, host, port) -> (position, pool key), first pool wins
+        self.opaque = []  # (position, pool key, compiled regexUrl), in document order
+        pools = unroutable = 0
+        for position, (pool_key, config) in enumerate(entries):
+            pools += 1
+            pattern = config.get("regexUrl") if isinstance(config, dict) else None
+            if not isinstance(pattern, str):
+                unroutable += 1
+                continue
+            target = literal_target(pattern)
+            if target is not None:
+                self.index.setdefault(target, (position, pool_key))
+                continue
+            try:
+                self.opaque.append((position, pool_key, re.compile(pattern)))
+            except re.error:
+                unroutable += 1  # the proxy cannot match it either
+        self.stats = RouterStats(pools, pools - len(self.opaque) - unroutable, len(self.opaque), unroutable)
+
+    @classmethod
+    def from_file(cls, path):
+        return cls((key, config) for section, key, config in iter_document(path) if section == "POOLS")
+
+    def route(self, url):
+        # The pool key the proxy would pick for `url`, or None
+        target = split_target(url)
+        literal = self.index.get(target) if target is not None else None
+        if not self.opaque:
+            return literal[1] if literal else None
+        last = literal[0] if literal else float("inf")
+        for position, pool_key, regex in self.opaque:
+            if position > last:
+                break
+            if regex.match(url):
+                return pool_key
+        return literal[1] if literal else None
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    path = "pools_output.json"
+    if args and not args[0].startswith(SCHEMES):
+        path, args = args[0], args[1:]
+    if not args:
+        print("Usage: python pool_router.py [pools_output.json] URL [URL ...]", file=sys.stderr)
+        return 2
+    try:
+        router = PoolRouter.from_file(path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load '{path}': {e}", file=sys.stderr)
+        return 1
+    for url in args:
+        print(f"{url} → {router.route(url) or '(no pool)'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
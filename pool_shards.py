@@ -0,0 +1,201 @@
+# 🧩 Sharded POOLS output: N smaller documents plus a manifest
+#
+# Rows are partitioned by a stable hash (crc32) of the pool name, or by port,
+# so both protocol entries of a row always land in the same shard. Every shard
+# is a complete {"POOLS": {...}} document (with the CONSTANTS section when
+# one is shared) written by its own worker. The manifest next to them lists
+# each shard's file, entry count, size and sha256:
+#
+#   pools_output.json -> pools_output.manifest.json
+#                        pools_output.shard-00-of-04-<sha256[:12]>.json ... shard-03-of-04-<...>.json
+#
+# Rows are partitioned into one compact HostStore per shard, so the workers
+# get columnar rows, never lists of tuples. Each shard is written to a
+# temporary file and renamed to a name carrying its digest, so files listed
+# by the previous manifest are never overwritten: a reader holding it keeps
+# seeing consistent shards until the new manifest is swapped in. Shard files
+# no longer listed (an older generation, or a larger SHARDS) are removed
+# after that.
+#
+# load_shards() reads the shards concurrently, checks them against the
+# manifest and merges them back into one mapping. verify_shards() checks them
+# against the manifest with pool_verify's streaming reader instead, without
+# loading any of them.
+import hashlib
+import json
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import compress, repeat
+from operator import eq
+
+from host_store import HostStore
+from pool_engine import DEFAULT_CHUNK_SIZE, encode_chunk, iter_chunks
+from pool_verify import verify_output
+from pool_writer import PoolJsonWriter
+
+MANIFEST_VERSION = 1
+SHARD_KEYS = ("hash", "port")
+DIGEST_CHARS = 12  # of the sha256 in a shard file name
+
+
+def manifest_path(output_path):
+    root, ext = os.path.splitext(output_path)
+    return f"{root}.manifest{ext}"
+
+
+def shard_path(output_path, index, shards, sha256):
+    root, ext = os.path.splitext(output_path)
+    return f"{root}.shard-{index:02d}-of-{shards:02d}-{sha256[:DIGEST_CHARS]}{ext}"
+
+
+def _is_shard_file(output_path, name):
+    root, ext = os.path.splitext(os.path.basename(output_path))
+    return name.startswith(f"{root}.shard-") and name.endswith(ext)
+
+
+def shard_of(hostname, port, shards, shard_by="hash"):
+    if shard_by == "port":
+        return int(port) % shards
+    pool_name = f"CUSTOMER_{hostname.upper()}_{port}"  # as in create_pool_entry
+    return zlib.crc32(pool_name.encode()) % shards
+
+
+def partition(host_port_list, shards, shard_by="hash"):
+    # One HostStore per shard, filled a column chunk at a time
+    if shard_by not in SHARD_KEYS:
+        raise ValueError(f"Unknown shard key '{shard_by}' (expected one of {', '.join(SHARD_KEYS)})")
+    if not isinstance(host_port_list, HostStore):
+        host_port_list = HostStore(host_port_list)
+    parts = [HostStore() for _ in range(shards)]
+    for _, hostnames, domains, ports in host_port_list.column_chunks():
+        owners = list(map(shard_of, hostnames, ports, repeat(shards), repeat(shard_by)))
+        for index, part in enumerate(parts):
+            mine = list(map(eq, owners, repeat(index)))
+            part.extend_columns(*(list(compress(column, mine)) for column in (hostnames, domains, ports)))
+    return parts
+
+
+def write_shard(output_path, index, shards, rows, constants, shared_section=None):
+    tmp_path = f"{output_path}.shard-{index:02d}.tmp"
+    with PoolJsonWriter(tmp_path, constants=shared_section, atomic=False) as writer:
+        for chunk in iter_chunks(rows, DEFAULT_CHUNK_SIZE):
+            for fragment in encode_chunk(chunk, constants):
+                writer.write_encoded(fragment)
+    path = shard_path(output_path, index, shards, writer.sha256)
+    os.replace(tmp_path, path)
+    return {
+        "path": os.path.basename(path),
+        "entries": writer.count,
+        "bytes": os.path.getsize(path),
+        "sha256": writer.sha256,
+    }
+
+
+def remove_orphans(output_path, manifest):
+    # Deletes shard files of `output_path` that `manifest` does not list
+    directory = os.path.dirname(os.path.abspath(output_path))
+    listed = {shard["path"] for shard in manifest["shards"]}
+    removed = []
+    for name in os.listdir(directory):
+        if _is_shard_file(output_path, name) and name not in listed:
+            os.remove(os.path.join(directory, name))
+            removed.append(name)
+    return removed
+
+
+def write_shards(output_path, host_port_list, constants, shards, shard_by="hash",
+                 shared_section=None, workers=None):
+    # Writes every shard (in parallel when more than one worker is available)
+    # and then the manifest; returns the manifest dict.
+    parts = partition(host_port_list, shards, shard_by)
+    workers = min(workers or os.cpu_count() or 1, shards)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(write_shard, repeat(output_path), range(shards), repeat(shards), parts,
+                                        repeat(constants), repeat(shared_section)))
+    else:
+        results = [write_shard(output_path, i, shards, rows, constants, shared_section)
+                   for i, rows in enumerate(parts)]
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "shard_by": shard_by,
+        "entries": sum(r["entries"] for r in results),
+        "shards": results,
+    }
+    path = manifest_path(output_path)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(f"{path}.tmp", path)  # readers never see a half-written manifest
+    remove_orphans(output_path, manifest)
+    return manifest
+
+
+def _read_manifest(path):
+    with open(path, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest version in '{path}'.")
+    return manifest
+
+
+def verify_shards(path):
+    # Streams every shard listed in the manifest at `path` through
+    # verify_output(): structure, regexUrl, sha256 and entry count. Returns
+    # the total entry count.
+    manifest = _read_manifest(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    total = 0
+    for shard in manifest["shards"]:
+        try:
+            check = verify_output(os.path.join(directory, shard["path"]), expected_sha256=shard["sha256"])
+        except ValueError as e:
+            raise ValueError(f"Shard '{shard['path']}': {e}") from None
+        if check.entries != shard["entries"]:
+            raise ValueError(f"Shard '{shard['path']}' has {check.entries} entries, "
+                             f"manifest says {shard['entries']}.")
+        total += check.entries
+    if total != manifest["entries"]:
+        raise ValueError(f"Shards hold {total} entries, manifest says {manifest['entries']}.")
+    return total
+
+
+def _read_shard(directory, shard, verify):
+    path = os.path.join(directory, shard["path"])
+    with open(path, "rb") as f:
+        data = f.read()
+    if verify and hashlib.sha256(data).hexdigest() != shard["sha256"]:
+        raise ValueError(f"Checksum mismatch for shard '{shard['path']}'.")
+    loaded = json.loads(data)
+    if "POOLS" not in loaded:
+        raise ValueError(f"Missing 'POOLS' key in shard '{shard['path']}'.")
+    if len(loaded["POOLS"]) != shard["entries"]:
+        raise ValueError(f"Shard '{shard['path']}' has {len(loaded['POOLS'])} entries, "
+                         f"manifest says {shard['entries']}.")
+    return loaded
+
+
+def load_shards(path, workers=None, verify=True):
+    # `path` is the manifest written by write_shards(). Returns
+    # {"POOLS": {...}}, with "CONSTANTS" first when the shards carry it.
+    manifest = _read_manifest(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    shards = manifest["shards"]
+    # Reading and hashing release the GIL, so threads overlap the I/O of one
+    # shard with the parsing of another.
+    with ThreadPoolExecutor(max_workers=workers or min(len(shards), os.cpu_count() or 1) or 1) as executor:
+        loaded = list(executor.map(lambda shard: _read_shard(directory, shard, verify), shards))
+
+    merged = {}
+    for document in loaded:
+        if "CONSTANTS" in document:
+            merged.setdefault("CONSTANTS", document["CONSTANTS"])
+    pools = merged["POOLS"] = {}
+    for shard, document in zip(shards, loaded):
+        before = len(pools)
+        pools.update(document["POOLS"])
+        if len(pools) != before + len(document["POOLS"]):
+            raise ValueError(f"Shard '{shard['path']}' repeats pool names found in another shard.")
+    return merged
@@ -0,0 +1,213 @@
+# 🔎 Streaming post-validation of pools_output.json
+#
+# Instead of json.load()-ing the whole output again, the file is read in
+# fixed-size blocks and walked one value at a time with raw_decode, so memory
+# stays at one block plus one pool entry however big the output is. In the
+# same pass it:
+#   - checks the {"POOLS": {...}} structure (other top-level keys such as
+#     CONSTANTS are allowed)
+#   - counts pool entries
+#   - checks that every regexUrl compiles (generator-shaped patterns are
+#     recognised without compiling them)
+#   - computes the sha256 of the file, and compares it with the digest the
+#     PoolJsonWriter computed while writing when one is given
+# With unique_names=True it also rejects a pool name that appears twice (a
+# JSON loader, like the proxy, would silently keep only one of them). That
+# keeps every name in a set, so memory then grows with the pool count; it is
+# off by default because the generators dedup on (hostname, port) and the
+# sha256 check already ties the file to what was written.
+import codecs
+import hashlib
+import json
+import re
+from collections import namedtuple
+
+READ_BYTES = 1 << 20
+
+OutputCheck = namedtuple("OutputCheck", "entries sha256 bytes has_constants")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# ^https://(host[.]domain):443/ with only label characters and [.] inside
+# the group always compiles, whatever the hostname
+_GENERATED_REGEX_URL = re.compile(r"\^https?://\((?:[a-zA-Z0-9-]|\[\.\])+\):443/")
+# The general literal form, parts captured: such a pattern matches exactly
+# the URLs that start with "<scheme>://<host>:<port>/"
+_LITERAL_REGEX_URL = re.compile(r"\^(https?)://\(((?:[a-zA-Z0-9-]|\[\.\]|\\\.)+)\):(\d{1,5})/")
+
+
+def literal_target(pattern):
+    # (scheme, host, port) for a literal regexUrl, None for anything else
+    match = _LITERAL_REGEX_URL.fullmatch(pattern)
+    if match is None:
+        return None
+    scheme, host, port = match.groups()
+    return scheme, host.replace("[.]", ".").replace("\\.", "."), port
+
+
+class _Reader:
+    def __init__(self, f, read_bytes):
+        self.f = f
+        self.read_bytes = read_bytes
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()  # js6.ps1 output starts with a BOM
+        self.json = json.JSONDecoder()
+        self.sha256 = hashlib.sha256()
+        self.bytes = 0
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        data = self.f.read(self.read_bytes)
+        self.sha256.update(data)
+        self.bytes += len(data)
+        self.eof = not data
+        self.buf = self.buf[self.pos:] + self.decoder.decode(data, final=self.eof)
+        self.pos = 0
+        return not self.eof
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char, what):
+        if self.peek() != char:
+            raise ValueError(f"Expected {what} at byte ~{self.bytes - len(self.buf) + self.pos}.")
+        self.pos += 1
+
+    def value(self, with_text=False):
+        # The next JSON value, or (value, its source text) with `with_text`
+        self.peek()
+        while True:
+            try:
+                value, end = self.json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self.fill():
+                    continue  # the value runs past the end of the block
+                raise ValueError(f"Invalid JSON: {e}") from None
+            # A number at the very end of the block may continue in the next one
+            if end == len(self.buf) and self.fill():
+                continue
+            start, self.pos = self.pos, end
+            return (value, self.buf[start:end]) if with_text else value
+
+
+def _check_regex_url(pool_key, pool_config):
+    if not isinstance(pool_config, dict):
+        raise ValueError(f"Pool '{pool_key}' is not an object.")
+    pattern = pool_config.get("regexUrl")
+    if not isinstance(pattern, str):
+        raise ValueError(f"Pool '{pool_key}' has no regexUrl.")
+    if _GENERATED_REGEX_URL.fullmatch(pattern):
+        return
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Pool '{pool_key}' has an invalid regexUrl: {e}") from None
+
+
+def _iter_pools(reader, with_text=False):
+    # Yields (pool key, pool config) from the POOLS object at the reader;
+    # the config is (value, source text) with `with_text`
+    reader.expect("{", "'POOLS' to be an object")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        pool_key = reader.value()
+        if not isinstance(pool_key, str):
+            raise ValueError("Pool names must be strings.")
+        reader.expect(":", f"':' after pool '{pool_key}'")
+        yield pool_key, reader.value(with_text)
+        separator = reader.peek()
+        reader.pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or '}}' after pool '{pool_key}'.")
+
+
+def _check_pools(reader, unique_names=False):
+    entries = 0
+    seen = set() if unique_names else None
+    for pool_key, pool_config in _iter_pools(reader):
+        if seen is not None:
+            if pool_key in seen:
+                raise ValueError(f"Pool '{pool_key}' appears more than once.")
+            seen.add(pool_key)
+        _check_regex_url(pool_key, pool_config)
+        entries += 1
+    return entries
+
+
+def iter_document(path, read_bytes=READ_BYTES, with_text=False):
+    # Streams a pools document as (section, key, value): ("POOLS", pool key,
+    # pool config) for each pool, (None, key, value) for any other top-level
+    # key such as CONSTANTS. With `with_text` every value is a (value, source
+    # text) pair. Raises ValueError if the file is not an object.
+    with open(path, "rb") as f:
+        reader = _Reader(f, read_bytes)
+        reader.expect("{", "a JSON object")
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                key = reader.value()
+                if not isinstance(key, str):
+                    raise ValueError("Top-level keys must be strings.")
+                reader.expect(":", f"':' after '{key}'")
+                if key == "POOLS":
+                    for pool_key, pool_config in _iter_pools(reader, with_text):
+                        yield "POOLS", pool_key, pool_config
+                else:
+                    yield None, key, reader.value(with_text)
+                separator = reader.peek()
+                reader.pos += 1
+                if separator == "}":
+                    break
+                if separator != ",":
+                    raise ValueError(f"Expected ',' or '}}' after '{key}'.")
+        if reader.peek():
+            raise ValueError("Unexpected data after the JSON document.")
+
+
+def verify_output(path, expected_sha256=None, read_bytes=READ_BYTES, unique_names=False):
+    # Returns OutputCheck(entries, sha256, bytes, has_constants); raises
+    # ValueError on the first problem found.
+    with open(path, "rb") as f:
+        reader = _Reader(f, read_bytes)
+        reader.expect("{", "a JSON object")
+        entries = None
+        has_constants = False
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                key = reader.value()
+                if not isinstance(key, str):
+                    raise ValueError("Top-level keys must be strings.")
+                reader.expect(":", f"':' after '{key}'")
+                if key == "POOLS":
+                    entries = _check_pools(reader, unique_names)
+                else:
+                    has_constants = has_constants or key == "CONSTANTS"
+                    reader.value()
+                separator = reader.peek()
+                reader.pos += 1
+                if separator == "}":
+                    break
+                if separator != ",":
+                    raise ValueError(f"Expected ',' or '}}' after '{key}'.")
+        if reader.peek():
+            raise ValueError("Unexpected data after the JSON document.")
+
+    if entries is None:
+        raise ValueError("Missing 'POOLS' key in JSON.")
+    sha256 = reader.sha256.hexdigest()
+    if expected_sha256 is not None and sha256 != expected_sha256:
+        raise ValueError(f"Output on disk (sha256 {sha256[:12]}…) does not match what was written "
+                         f"(sha256 {expected_sha256[:12]}…).")
+    return OutputCheck(entries, sha256, reader.bytes, has_constants)
@@ -0,0 +1,163 @@
+# 👀 Resident watch mode: regenerate pools_output.json when the inventory changes
+#
+# One process stays up and waits on the inventory instead of an operator
+# re-running jq4.py.bat after every edit. Changes are seen through inotify on
+# Linux (the directory is watched, so editors that save by rename are caught
+# too) or by polling the file's size, mtime and inode anywhere else. A burst
+# of events is debounced into one rebuild once the file has been quiet for
+# `debounce` seconds; the rebuild is poolgen.update_file(), which only builds
+# new or changed rows and swaps the new output in with os.replace. Each
+# rebuild reports its latency from the first change event and from the
+# file's mtime to the moment the new output is in place.
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+DEBOUNCE_S = 0.25
+POLL_INTERVAL_S = 0.5
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len; then `len` bytes of name
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+class PollingWatcher:
+    def __init__(self, path, interval=POLL_INTERVAL_S):
+        self.path = path
+        self.interval = interval
+        self._signature = _file_signature(path)
+
+    def wait(self, timeout=None):
+        # True once the file differs from the last time it was seen, False if
+        # `timeout` seconds pass first (None waits forever)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            signature = _file_signature(self.path)
+            if signature != self._signature:
+                self._signature = signature
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                time.sleep(min(self.interval, remaining))
+            else:
+                time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    def __init__(self, path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self.name = os.fsencode(os.path.basename(path))
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        directory = os.fsencode(os.path.dirname(os.path.abspath(path)))
+        if libc.inotify_add_watch(self._fd, directory, WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory!r}")
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return False
+            if self._read_matches():
+                return True
+
+    def _read_matches(self):
+        # Drains pending events; True if any of them names the watched file
+        matched = False
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            matched = matched or name == self.name
+        return matched
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(path, use_inotify=True, poll_interval=POLL_INTERVAL_S):
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(path)
+        except (OSError, AttributeError):  # no inotify in this libc or kernel
+            pass
+    return PollingWatcher(path, poll_interval)
+
+
+def watch(input_path, output_path, rebuild, debounce=DEBOUNCE_S, use_inotify=True, poll_interval=POLL_INTERVAL_S,
+          report=print, max_rebuilds=None):
+    # `rebuild()` regenerates output_path from input_path and returns a
+    # short description of what it did. Runs until interrupted, or until
+    # `max_rebuilds` rebuilds after the initial one.
+    watcher = open_watcher(input_path, use_inotify, poll_interval)
+    report(f"👀 Watching '{input_path}' ({type(watcher).__name__}, {debounce * 1e3:.0f} ms debounce) "
+           f"→ '{output_path}'")
+    rebuilds = 0
+    try:
+        _run(rebuild, report)
+        while max_rebuilds is None or rebuilds < max_rebuilds:
+            watcher.wait()
+            first_event_ns = time.time_ns()
+            while watcher.wait(debounce):
+                pass  # keep waiting until the burst of edits is over
+            try:
+                edited_ns = os.stat(input_path).st_mtime_ns
+            except OSError:
+                report(f"⚠️ '{input_path}' is missing — waiting for it to come back.")
+                continue
+            _run(rebuild, report, first_event_ns, edited_ns)
+            rebuilds += 1
+    except KeyboardInterrupt:
+        report("👋 Watch stopped.")
+    finally:
+        watcher.close()
+
+
+def _run(rebuild, report, first_event_ns=None, edited_ns=None):
+    start_ns = time.perf_counter_ns()
+    try:
+        summary = rebuild()
+    except (OSError, ValueError) as e:
+        report(f"❌ Rebuild failed: {e}")
+        return
+    done_ns = time.time_ns()
+    line = f"♻️ {summary} in {(time.perf_counter_ns() - start_ns) / 1e6:,.1f} ms"
+    if first_event_ns is not None:
+        line += (f"; last edit → new config {(done_ns - edited_ns) / 1e6:,.1f} ms "
+                 f"({(done_ns - first_event_ns) / 1e6:,.1f} ms after the first change event)")
+    report(line)
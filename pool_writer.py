@@ -0,0 +1,101 @@
+# 📝 Incremental writer for the {"POOLS": {...}} document
+#
+# Each pool entry is serialized and written as soon as it is produced, so the
+# full pools dict never has to sit in memory. The bytes on disk are identical
+# to json.dump({"POOLS": pools}, f, indent=2), or to
+# json.dump({"CONSTANTS": constants, "POOLS": pools}, f, indent=2) when a shared
+# constants section is given. write() skips a pool key it has already written,
+# the way the pools dict the scripts used to build kept one entry per key;
+# write_encoded() fragments are the caller's to dedup (the generators dedup on
+# (hostname, port)). A sha256 of the bytes written is kept so the file can be
+# checked later without re-parsing.
+#
+# The document goes to "<path>.tmp" and is swapped in with os.replace only
+# when the with-block exits cleanly, so a build that fails partway leaves the
+# previous output in place instead of a truncated but valid document. Pass
+# atomic=False when the caller writes to a temporary path of its own.
+import hashlib
+import json
+import os
+
+ENTRY_INDENT = "\n    "
+NEWLINE_EXTRA = len(os.linesep) - 1  # text mode writes os.linesep for every "\n"
+
+
+def encode_entry(pool_key, pool_config):
+    body = json.dumps(pool_config, indent=2).replace("\n", ENTRY_INDENT)
+    return f"{json.dumps(pool_key)}: {body}"
+
+
+class PoolJsonWriter:
+    def __init__(self, path, constants=None, atomic=True):
+        self.path = path
+        self.constants = constants
+        self.atomic = atomic
+        self.count = 0
+        self.skipped = 0  # repeated pool keys passed to write()
+        self._keys = set()
+        self.offset = 0  # bytes written so far; output is ASCII (ensure_ascii)
+        self._sha256 = hashlib.sha256()
+        self._f = None
+
+    def __enter__(self):
+        self._f = open(self._target, "w")
+        self._write("{\n")
+        if self.constants is not None:
+            section = json.dumps(self.constants, indent=2).replace("\n", "\n  ")
+            self._write(f'  "CONSTANTS": {section},\n')
+        self._write('  "POOLS": {')
+        self._f.flush()
+        return self
+
+    @property
+    def _target(self):
+        return f"{self.path}.tmp" if self.atomic else self.path
+
+    def _write(self, text):
+        self._f.write(text)
+        self.offset += len(text)
+        if NEWLINE_EXTRA:
+            self.offset += text.count("\n") * NEWLINE_EXTRA
+            text = text.replace("\n", os.linesep)
+        self._sha256.update(text.encode("ascii"))
+
+    @property
+    def sha256(self):
+        # Digest of the bytes written so far, as they land on disk
+        return self._sha256.hexdigest()
+
+    def write(self, pool_key, pool_config):
+        if pool_key in self._keys:
+            self.skipped += 1
+            return
+        self._keys.add(pool_key)
+        self.write_encoded(encode_entry(pool_key, pool_config))
+
+    def write_all(self, pools):
+        for pool_key, pool_config in pools.items():
+            self.write(pool_key, pool_config)
+
+    def write_encoded(self, fragment, entries=1):
+        # `fragment` may hold several comma-separated entries (e.g. a row
+        # copied from a previous run); returns its byte offset in the file.
+        self._write(",\n    " if self.count else "\n    ")
+        start = self.offset
+        self._write(fragment)
+        self.count += entries
+        return start
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._write("\n  }\n}" if self.count else "}\n}")
+        finally:
+            self._f.close()
+            self._f = None
+        if exc_type is not None:
+            if self.atomic:
+                os.remove(self._target)
+        elif self.atomic:
+            os.replace(self._target, self.path)
+        return False
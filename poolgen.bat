@@ -0,0 +1 @@
+python poolgen.py %*
\ No newline at end of file
@@ -0,0 +1,350 @@
+# 📚 Importable pool generation: generate(inventory) -> pools
+#
+# The jq*.py scripts parse, validate, build and write as one run of a fresh
+# interpreter. This module is the same pipeline as plain functions: importing
+# it does no work, the validator, engine and writer modules are imported on
+# first use, and the default constants are built once per process. A
+# long-running process or a test can call generate() as often as it likes;
+# `python poolgen.py` is the CLI (poolgen.bat on Windows).
+#
+#   pools = generate("o.glb.ac.com\t12345\n")           # {"CUSTOMER_O_12345_HTTPS": {...}, ...}
+#   pools = generate(open("fqdn_input.txt"), errors=collector)
+#   stats = write_file("fqdn_input.txt", "pools_output.json")
+#   stats = update_file("fqdn_input.txt", "pools_output.json")  # incremental, atomic swap
+#   stats = write_file_external("huge.txt", "pools_output.json")  # sorted, bounded memory
+#
+# jq4.py runs the same steps (validate_file(), write_rows(), update_rows())
+# with its configuration flags, so the constants and the pipeline live here
+# only. PoolStream is generate() for input that arrives in pieces (the POST
+# /pools endpoint in app1.py): raw bytes in, pieces of the JSON document out.
+#
+# `python poolgen.py --watch` stays resident and runs update_file() whenever
+# the inventory changes (pool_watch.py).
+import codecs
+import functools
+import json
+import sys
+
+DEFAULT_INPUT = "fqdn_input.txt"
+DEFAULT_OUTPUT = "pools_output.json"
+DEFAULT_WHITELIST = "CONSTANTS:my_whitelist"
+DEFAULT_LOCAL_SUBNETS = ("100.116.121.0/24", "100.124.121.0/24")
+DEFAULT_URL_REWRITES = (
+    ("100[.]116[.]123[.]240", "epm.glb.cala.attmx.avayacloud.com"),
+    ("100[.]124[.]123[.]240", "epmgeo.glb.cala.attmx.avayacloud.com"),
+)
+DEFAULT_HEADER_UPDATES = (("TerminationURL", "http", "https"),)
+LINES_PER_BLOCK = 4096  # lines joined per validator block for iterable input
+_DEFAULT = object()
+
+
+@functools.lru_cache(maxsize=None)
+def default_constants():
+    # jq4.py's localSubnets / urlQueryStringReplace / responseHeadersUpdate /
+    # whitelist. Cached, so every pool built with the defaults shares one set
+    # of lists; treat the result as read-only.
+    from pool_engine import make_constants
+
+    return make_constants(
+        list(DEFAULT_LOCAL_SUBNETS),
+        [{"regex": regex, "replace": replace} for regex, replace in DEFAULT_URL_REWRITES],
+        [{"header": header, "regex": regex, "replace": replace} for header, regex, replace in DEFAULT_HEADER_UPDATES],
+        DEFAULT_WHITELIST,
+    )
+
+
+def _iter_text_blocks(inventory):
+    # Line-aligned text blocks from a string, a text file object or an
+    # iterable of lines (with or without their trailing newline)
+    if isinstance(inventory, str):
+        yield inventory
+    elif hasattr(inventory, "read"):
+        from validator import iter_blocks
+
+        yield from iter_blocks(inventory)
+    else:
+        from pool_engine import iter_chunks
+
+        for lines in iter_chunks(inventory, LINES_PER_BLOCK):
+            yield "\n".join(line.rstrip("\n") for line in lines) + "\n"
+
+
+def validate(inventory, errors=None):
+    # Returns (host_port_list, errors) exactly as validator.validate_file()
+    # would for the same text; `errors` may be any append/extend sink, such
+    # as an error_report.ErrorCollector.
+    from validator import BulkValidator
+
+    validator = BulkValidator(errors)
+    for block in _iter_text_blocks(inventory):
+        validator.feed(block)
+    return validator.finish()
+
+
+def build(host_port_list, constants=None):
+    # Serial, in-process build: no calibration and no executor start-up,
+    # which is what repeated small calls want
+    from pool_engine import build_chunk
+
+    return build_chunk(host_port_list, constants if constants is not None else default_constants())
+
+
+def generate(inventory, constants=None, errors=None):
+    # Inventory text (or lines, or a file object) -> POOLS dict. Invalid and
+    # duplicate rows are skipped and reported to `errors` when given.
+    host_port_list, _ = validate(inventory, errors)
+    return build(host_port_list, constants)
+
+
+class PoolStream:
+    # Feed raw inventory bytes as they arrive; every call returns the next
+    # piece of the {"POOLS": ...} document for the rows validated so far.
+    # Rows are dropped from the validator's store as soon as they are
+    # encoded, so what is kept per request is the unvalidated tail of the
+    # input and the validator's (hostname, port) dedup keys, never the body,
+    # the rows or the document. The pieces concatenate to what
+    # PoolJsonWriter would write; with error_summary=True and an
+    # ErrorCollector as `errors`, a trailing "ERRORS" summary is added when
+    # it saw any.
+    def __init__(self, constants=None, errors=None, block_bytes=None, encoding="utf-8", error_summary=False):
+        from validator import BLOCK_BYTES, BulkValidator
+
+        self.constants = constants if constants is not None else default_constants()
+        self.block_bytes = block_bytes or BLOCK_BYTES
+        self.validator = BulkValidator(errors)
+        self.error_summary = error_summary
+        self.count = 0  # entries emitted
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._pending = ""
+        self._opened = False
+
+    def feed(self, data):
+        self._pending += self._decoder.decode(data)
+        if len(self._pending) < self.block_bytes:
+            return ""
+        cut = self._pending.rfind("\n") + 1
+        if not cut:
+            return ""
+        block, self._pending = self._pending[:cut], self._pending[cut:]
+        self.validator.feed(block)
+        return self._encode_new_rows()
+
+    def finish(self):
+        self._pending += self._decoder.decode(b"", final=True)
+        if self._pending:
+            self.validator.feed(self._pending)
+            self._pending = ""
+        _, errors = self.validator.finish()
+        parts = [self._encode_new_rows(), "\n  }" if self.count else "}"]
+        if self.error_summary and errors and hasattr(errors, "as_dict"):
+            summary = json.dumps(errors.as_dict(), indent=2).replace("\n", "\n  ")
+            parts.append(f',\n  "ERRORS": {summary}')
+        parts.append("\n}")
+        return "".join(parts)
+
+    def _encode_new_rows(self):
+        from host_store import HostStore
+        from pool_engine import encode_chunk
+
+        new_rows = self.validator.host_port_list
+        self.validator.host_port_list = HostStore()
+        parts = []
+        if not self._opened:
+            parts.append('{\n  "POOLS": {')
+            self._opened = True
+        for fragment in encode_chunk(new_rows, self.constants):
+            parts.append(",\n    " if self.count else "\n    ")
+            parts.append(fragment)
+            self.count += 1
+        return "".join(parts)
+
+
+def pool_constants(constants=None, shared_constants=False):
+    # (CONSTANTS section or None, constants for the entries), defaulting to
+    # default_constants()
+    constants = constants if constants is not None else default_constants()
+    if not shared_constants:
+        return None, constants
+    from pool_engine import hoist_constants
+
+    return hoist_constants(constants)
+
+
+def validate_file(input_path=DEFAULT_INPUT, errors=None, workers=None, bloom=False, mmap_threshold=_DEFAULT):
+    # jq4.py's bulk pre-validation: blocks checked across `workers` processes
+    # for large inputs (validator.validate_file_parallel), or one process with
+    # the bloom-filter prefilter (bloom_dedup.py). Returns
+    # (host_port_list, errors).
+    if bloom:
+        from bloom_dedup import validate_file_bloom
+
+        return validate_file_bloom(input_path, errors=errors)
+    from inventory import MMAP_THRESHOLD
+    from validator import validate_file_parallel
+
+    return validate_file_parallel(input_path, workers=workers, errors=errors,
+                                  mmap_threshold=MMAP_THRESHOLD if mmap_threshold is _DEFAULT else mmap_threshold)
+
+
+def _profiler(profiler):
+    from pool_profile import StageProfiler
+
+    return profiler or StageProfiler()  # disabled: stages cost nothing
+
+
+def write_rows(host_port_list, output_path=DEFAULT_OUTPUT, constants=None, shared_section=None, workers=None,
+               profiler=None):
+    # Validated rows -> output file: pick an executor from a measured sample
+    # and stream every entry to disk as soon as it is ready
+    from pool_engine import calibrate, run_plan
+    from pool_writer import PoolJsonWriter
+
+    constants = constants if constants is not None else default_constants()
+    profiler = _profiler(profiler)
+    with profiler.stage("calibrate"):
+        plan = calibrate(host_port_list, constants, workers=workers)
+    with profiler.stage("build_serialize"):
+        with PoolJsonWriter(output_path, constants=shared_section) as writer:
+            for fragments in run_plan(plan, host_port_list, constants):
+                for fragment in fragments:
+                    writer.write_encoded(fragment)
+    return {"rows": len(host_port_list), "entries": writer.count, "sha256": writer.sha256, "plan": plan}
+
+
+def update_rows(host_port_list, output_path=DEFAULT_OUTPUT, constants=None, shared_section=None, workers=None,
+                profiler=None):
+    # jq4.py's INCREMENTAL path: only new or changed rows are built, the rest
+    # is copied from the previous output, and the result replaces it atomically
+    from pool_cache import BuildCache
+    from pool_engine import calibrate, run_plan
+
+    constants = constants if constants is not None else default_constants()
+    profiler = _profiler(profiler)
+    with profiler.stage("cache_diff"):
+        cache = BuildCache(output_path, constants, shared_section)
+        digests, missing, up_to_date = cache.diff(host_port_list)
+    stats = {"rows": len(host_port_list), "up_to_date": up_to_date, "plan": None, "sha256": None}
+    if up_to_date:
+        stats.update(built=0, reused=len(digests), removed=0)
+        return stats
+    with profiler.stage("calibrate"):
+        plan = calibrate(missing, constants, workers=workers)
+    with profiler.stage("build_serialize"):
+        built = (fragment for fragments in run_plan(plan, missing, constants) for fragment in fragments)
+        stats.update(cache.write(digests, built), plan=plan)
+    return stats
+
+
+def write_file(input_path=DEFAULT_INPUT, output_path=DEFAULT_OUTPUT, constants=None, errors=None,
+               shared_constants=False, workers=None):
+    # The jq4.py pipeline without its cache or shards
+    shared_section, constants = pool_constants(constants, shared_constants)
+    host_port_list, errors = validate_file(input_path, errors, workers)
+    stats = write_rows(host_port_list, output_path, constants, shared_section, workers)
+    stats["errors"] = len(errors)
+    return stats
+
+
+def write_file_external(input_path=DEFAULT_INPUT, output_path=DEFAULT_OUTPUT, constants=None, errors=None,
+                        shared_constants=False, run_rows=None, tmp_dir=None):
+    # For inventories larger than RAM: dedup by external sort and merge
+    # (external_dedup.py) and stream the rows out in (hostname, port) order
+    # on one core; memory stays at one sorted run whatever the input size.
+    from external_dedup import RUN_ROWS, ExternalDedup
+    from pool_engine import DEFAULT_CHUNK_SIZE, encode_chunk, iter_chunks
+    from pool_writer import PoolJsonWriter
+
+    shared_section, constants = pool_constants(constants, shared_constants)
+
+    with ExternalDedup(errors, run_rows or RUN_ROWS, tmp_dir) as dedup:
+        dedup.add_file(input_path)
+        with PoolJsonWriter(output_path, constants=shared_section) as writer:
+            for chunk in iter_chunks(dedup, DEFAULT_CHUNK_SIZE):
+                for fragment in encode_chunk(chunk, constants):
+                    writer.write_encoded(fragment)
+    return {"rows": dedup.rows, "entries": writer.count, "errors": len(dedup.errors),
+            "duplicates": dedup.duplicates, "sha256": writer.sha256}
+
+
+def update_file(input_path=DEFAULT_INPUT, output_path=DEFAULT_OUTPUT, constants=None, errors=None,
+                shared_constants=False, workers=None):
+    # validate_file() then update_rows()
+    shared_section, constants = pool_constants(constants, shared_constants)
+    host_port_list, errors = validate_file(input_path, errors, workers)
+    stats = update_rows(host_port_list, output_path, constants, shared_section, workers)
+    stats["errors"] = len(errors)
+    return stats
+
+
+def main(argv=None):
+    import argparse
+
+    from error_report import DEFAULT_EXAMPLES, ErrorCollector
+
+    parser = argparse.ArgumentParser(description="Generate POOLS JSON from an FQDN/port inventory")
+    parser.add_argument("inventory", nargs="?", default=DEFAULT_INPUT)
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--shared-constants", action="store_true",
+                        help="emit repeated blocks once under CONSTANTS and reference them")
+    parser.add_argument("--check", action="store_true", help="only validate the inventory, write nothing")
+    parser.add_argument("--watch", action="store_true",
+                        help="stay resident and rebuild incrementally whenever the inventory changes")
+    parser.add_argument("--debounce", type=float, default=None, help="seconds of quiet before a watch rebuild")
+    parser.add_argument("--poll", action="store_true", help="watch by polling instead of inotify")
+    parser.add_argument("--external", action="store_true",
+                        help="dedup by external sort for inventories larger than RAM (output sorted by host, port)")
+    parser.add_argument("--run-rows", type=int, default=None, help="rows per sorted run in --external mode")
+    parser.add_argument("--tmp-dir", default=None, help="where --external spills its sorted runs")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--error-examples", type=int, default=DEFAULT_EXAMPLES)
+    parser.add_argument("--error-file", default=None, help="also write every validation error to this file")
+    args = parser.parse_args(argv)
+    if args.watch:
+        return _watch(args)
+
+    with ErrorCollector(args.error_examples, args.error_file) as errors:
+        if args.check:
+            with open(args.inventory, "r") as f:
+                host_port_list, _ = validate(f, errors)
+            stats = {"rows": len(host_port_list)}
+        elif args.external:
+            stats = write_file_external(args.inventory, args.output, errors=errors,
+                                        shared_constants=args.shared_constants, run_rows=args.run_rows,
+                                        tmp_dir=args.tmp_dir)
+        else:
+            stats = write_file(args.inventory, args.output, errors=errors,
+                               shared_constants=args.shared_constants, workers=args.workers)
+
+    if errors:
+        print(f"⚠️ Issues Found: {len(errors):,}")
+        for line in errors.summary_lines():
+            print(line)
+    if args.check:
+        print(f"🔎 {stats['rows']:,} valid rows in '{args.inventory}'.")
+    else:
+        print(f"💾 {stats['entries']:,} pool entries from {stats['rows']:,} rows saved as '{args.output}'.")
+    return 1 if args.check and errors else 0
+
+
+def _watch(args):
+    from error_report import ErrorCollector
+    from pool_watch import DEBOUNCE_S, watch
+
+    def rebuild():
+        with ErrorCollector(args.error_examples, args.error_file) as errors:
+            stats = update_file(args.inventory, args.output, errors=errors,
+                                shared_constants=args.shared_constants, workers=args.workers)
+        for line in errors.summary_lines():
+            print(line)
+        if stats["up_to_date"]:
+            return f"{stats['rows']:,} rows, output already up to date"
+        return (f"{stats['rows']:,} rows ({stats['built']} built, {stats['reused']} reused, "
+                f"{stats['removed']} removed, {stats['errors']:,} issues)")
+
+    debounce = DEBOUNCE_S if args.debounce is None else args.debounce
+    watch(args.inventory, args.output, rebuild, debounce=debounce, use_inotify=not args.poll)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
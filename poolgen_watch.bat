@@ -0,0 +1 @@
+python poolgen.py --watch %*
\ No newline at end of file
@@ -0,0 +1,335 @@
+# ✅ Bulk FQDN/port pre-validation
+#
+# Same rules, the same per-line messages and the same line numbering as the
+# per-line loop in jq4.py, but a whole block of text is validated by one
+# compiled pattern instead of a Python round trip per line:
+#   - REGULAR_LINE matches a valid "fqdn<TAB>port" line outright (the FQDN
+#     rules of fqdn_pattern, ports 1-65535 without leading zeros) and
+#     captures hostname, domain and port; one findall() over the block gives
+#     a tuple per line
+#   - any line it does not match (spaces, extra columns, blank lines, "0080",
+#     or a line that is really invalid) goes through check_line(), the
+#     original per-line logic, which also words the message
+#   - duplicate detection is a pair of set operations unless the block really
+#     contains a duplicate
+# Only the lines the pattern rejects are looked at individually, so the cost
+# of a block with a handful of bad lines stays close to a clean one.
+import gc
+import locale
+import os
+import re
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, compress, repeat
+from operator import eq, itemgetter, mod, ne, not_
+
+from host_store import PORT_STRINGS, HostStore
+from inventory import MMAP_THRESHOLD, iter_mapped_blocks
+
+fqdn_pattern = re.compile(r"^(?!-)([a-zA-Z0-9-]{1,63}(?<!-)\.)+[a-zA-Z]{2,63}$")
+VALID_PORTS = frozenset(PORT_STRINGS[1:])
+BLOCK_BYTES = 1 << 16
+
+_LABEL = r"[a-zA-Z0-9-]{1,63}(?<!-)"
+_PORT = r"[1-9][0-9]{0,3}|[1-5][0-9]{4}|6[0-4][0-9]{3}|65[0-4][0-9]{2}|655[0-2][0-9]|6553[0-5]"
+# (hostname, domain, port, "") for a valid line, ("", "", "", line) otherwise
+REGULAR_LINE = re.compile(rf"^(?:(?!-)({_LABEL})\.((?:{_LABEL}\.)*[a-zA-Z]{{2,63}})\t({_PORT})|(.*))$", re.M)
+KEY_FORMAT = "{}:{}".format  # host_store.duplicate_key() without a Python call per row
+
+_hostname = itemgetter(0)
+_domain = itemgetter(1)
+_port = itemgetter(2)
+
+
+def is_valid_port(port):
+    if port in VALID_PORTS:
+        return True
+    try:
+        return port.isdigit() and 1 <= int(port) <= 65535  # e.g. "0080"
+    except ValueError:  # digits int() cannot parse, such as "²"
+        return False
+
+
+def check_line(line):
+    # Returns (message, None) for a bad line or (None, (hostname, domain, port))
+    parts = line.strip().split()
+    if len(parts) < 2:
+        return f"Invalid format - '{line.strip()}'", None
+
+    fqdn, port = parts[0], parts[1]
+    if not fqdn_pattern.match(fqdn):
+        return f"Invalid FQDN - '{fqdn}'", None
+    if not is_valid_port(port):
+        return f"Invalid TCP port - '{port}'", None
+
+    hostname, _, domain = fqdn.partition(".")
+    return None, (hostname, domain, port)
+
+
+def _flag(flags, indexes):
+    for i in indexes:
+        flags[i] = 1
+
+
+def check_block(body):
+    # Validates the lines of `body` on their own (no duplicate detection).
+    # Returns (line count, {line index: message}, line indexes of the valid
+    # rows, lowercased hostnames, domains, ports), the last four aligned.
+    matches = REGULAR_LINE.findall(body)
+    n = len(matches)
+    problems = {}  # block line index -> message; at most one per line
+    hostnames = list(map(_hostname, matches))
+
+    if all(hostnames):
+        regular = range(n)
+    else:
+        keep = bytearray(map(bool, hostnames))
+        for i in compress(range(n), map(not_, keep)):
+            message, row = check_line(matches[i][3])
+            if message:
+                problems[i] = message
+            else:
+                matches[i] = row
+                keep[i] = 1
+        regular = list(compress(range(n), keep))
+        matches = list(compress(matches, keep))
+        hostnames = list(map(_hostname, matches))
+
+    domains = list(map(_domain, matches))
+    ports = list(map(_port, matches))
+    hostnames = "\n".join(hostnames).lower().split("\n") if hostnames else []
+    return n, problems, regular, hostnames, domains, ports
+
+
+def find_duplicates(keys, seen_keys):
+    # Marks every key already in `seen_keys` or earlier in `keys`, then adds
+    # the block's keys to `seen_keys`. Returns a bytearray mask or None.
+    block_keys = set(keys)
+    if len(block_keys) == len(keys) and seen_keys.isdisjoint(block_keys):
+        seen_keys |= block_keys
+        return None
+    # Filled back to front, so every key maps to its first position
+    first = dict(zip(reversed(keys), range(len(keys) - 1, -1, -1)))
+    duplicate = bytearray(map(ne, map(first.__getitem__, keys), range(len(keys))))
+    _flag(duplicate, compress(range(len(keys)), map(seen_keys.__contains__, keys)))
+    seen_keys |= block_keys
+    return duplicate
+
+
+class BulkValidator:
+    def __init__(self, errors=None):
+        self.host_port_list = HostStore()
+        self.errors = [] if errors is None else errors  # anything with append/extend
+        self.seen_keys = set()  # KEY_FORMAT strings
+        self.line_no = 0
+        self._carry = ""  # trailing blank lines, numbered only if more input follows
+
+    def feed(self, text):
+        text = self._carry + text
+        if not self.line_no:
+            # Leading blank lines are not counted, as with raw_input.strip()
+            text = text.lstrip()
+        body = text.rstrip()
+        if not body:
+            # Nothing but blank lines: keep all of them pending
+            self._carry = text
+            return
+        tail = text[len(body):]
+        # The first newline of the tail ends body's last line; the rest are
+        # whole blank lines that only count if a non-blank line follows.
+        self._carry = tail[tail.index("\n") + 1:] if "\n" in tail else ""
+        # The block allocates a few tuples per line and frees none of them, so
+        # cyclic GC passes during it are pure overhead.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._validate_block(body)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def finish(self):
+        self._carry = ""
+        return self.host_port_list, self.errors
+
+    def _validate_block(self, body):
+        base = self.line_no + 1
+        n, problems, regular, hostnames, domains, ports = check_block(body)
+        self.line_no += n
+
+        keys = list(map(KEY_FORMAT, hostnames, ports))
+        duplicate = find_duplicates(keys, self.seen_keys)
+        if duplicate is None:
+            self.host_port_list.extend_columns(hostnames, domains, ports)
+        else:
+            for j in compress(range(len(keys)), duplicate):
+                problems[regular[j]] = f"Duplicate hostname '{hostnames[j]}' and port '{ports[j]}'"
+            keep = bytearray(map(not_, duplicate))
+            self.host_port_list.extend_columns(list(compress(hostnames, keep)), list(compress(domains, keep)),
+                                               list(compress(ports, keep)))
+
+        if problems:
+            self.errors.extend(f"Line {base + i}: {problems[i]}" for i in sorted(problems))
+
+
+def iter_blocks(f, block_bytes=BLOCK_BYTES):
+    # Reads ~block_bytes at a time, always ending on a line boundary
+    while True:
+        block = f.read(block_bytes)
+        if not block:
+            return
+        if not block.endswith("\n"):
+            block += f.readline()
+        yield block
+
+
+def validate_file(path, block_bytes=BLOCK_BYTES, mmap_threshold=MMAP_THRESHOLD, errors=None):
+    validator = BulkValidator(errors)
+    if mmap_threshold is not None and os.path.getsize(path) >= mmap_threshold:
+        for block in iter_mapped_blocks(path, block_bytes):
+            validator.feed(block)
+    else:
+        with open(path, "r") as f:
+            for block in iter_blocks(f, block_bytes):
+                validator.feed(block)
+    return validator.finish()
+
+
+# 🧵 Parallel validation over byte ranges
+#
+# The file is cut into line-aligned byte ranges that worker processes check
+# with check_block(). Duplicate detection is then split by key rather than by
+# range: every valid row's KEY_FORMAT key is routed by crc32 to one of
+# `partitions` owners, and each owner walks its keys in file order, so "first
+# occurrence wins" holds with no shared set. The parent only stitches line
+# numbers, errors and columns back together.
+PARALLEL_MIN_BYTES = 32 << 20  # below this, process start-up costs more than it saves
+PARALLEL_CHUNK_BYTES = 4 << 20
+MAX_PARTITIONS = 256  # dedup owners are kept one byte per row
+BLANK_MESSAGE = "Invalid format - ''"  # what check_line() reports for a blank line
+
+
+def byte_ranges(path, chunk_bytes):
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()  # run on to the end of the line
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _check_range(path, start, end, partitions, encoding):
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding)
+    # Universal newlines, as open(path, "r") would give
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if text.endswith("\n"):
+        text = text[:-1]
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        n, problems, regular, hostnames, domains, ports = check_block(text)
+        blank = {i for i, message in problems.items() if message == BLANK_MESSAGE}
+        first = next((i for i in range(n) if i not in blank), None)
+        last = next((i for i in reversed(range(n)) if i not in blank), None)
+
+        keys = list(map(KEY_FORMAT, hostnames, ports))
+        owners = bytes(map(mod, map(zlib.crc32, "\n".join(keys).encode().split(b"\n")), repeat(partitions))) \
+            if keys else b""
+        owned = []
+        for owner in range(partitions):
+            mine = bytes(map(eq, owners, repeat(owner)))
+            owned.append(("\n".join(compress(keys, mine)), array("I", compress(range(len(keys)), mine))))
+
+        domain_table = sorted(set(domains))
+        domain_ids = array("I", map({d: i for i, d in enumerate(domain_table)}.__getitem__, domains))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        "lines": n,
+        "first": first,
+        "last": last,
+        "problems": sorted(problems.items()),
+        "regular": array("I", regular),
+        "hostnames": "\n".join(hostnames),
+        "domains": (domain_table, domain_ids),
+        "ports": "\n".join(ports),
+        "owned": owned,
+    }
+
+
+def _owner_duplicates(payloads):
+    # `payloads` is one owner's (range index, keys, row positions) per range,
+    # in file order. Returns (range index, duplicate row positions) pairs.
+    seen_keys = set()
+    found = []
+    for index, keys_text, positions in payloads:
+        if not positions:
+            continue
+        duplicate = find_duplicates(keys_text.split("\n"), seen_keys)
+        if duplicate is not None:
+            found.append((index, array("I", compress(positions, duplicate))))
+    return found
+
+
+def validate_file_parallel(path, workers=None, partitions=None, chunk_bytes=PARALLEL_CHUNK_BYTES,
+                           min_bytes=PARALLEL_MIN_BYTES, mmap_threshold=MMAP_THRESHOLD, errors=None):
+    # Same result as validate_file(); falls back to it for small files or a
+    # single worker.
+    workers = workers or os.cpu_count() or 1
+    ranges = byte_ranges(path, chunk_bytes) if os.path.getsize(path) >= min_bytes else []
+    if workers < 2 or len(ranges) < 2:
+        return validate_file(path, mmap_threshold=mmap_threshold, errors=errors)
+    errors = [] if errors is None else errors
+    partitions = min(partitions or workers, MAX_PARTITIONS)
+    encoding = locale.getpreferredencoding(False)  # what open(path, "r") uses
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        starts, ends = zip(*ranges)
+        results = list(executor.map(_check_range, repeat(path), starts, ends, repeat(partitions),
+                                    repeat(encoding)))
+        payloads = [[(index, *result["owned"][owner]) for index, result in enumerate(results)]
+                    for owner in range(partitions)]
+        duplicates = [bytearray(len(result["regular"])) for result in results]
+        for found in executor.map(_owner_duplicates, payloads):
+            for index, positions in found:
+                _flag(duplicates[index], positions)
+
+    # Global line numbers skip leading blank lines and drop trailing ones
+    offsets = list(accumulate((result["lines"] for result in results), initial=0))
+    marks = [offsets[i] + result["first"] for i, result in enumerate(results) if result["first"] is not None]
+    host_port_list = HostStore()
+    if not marks:
+        return host_port_list, errors
+    first = marks[0]
+    last = max(offsets[i] + result["last"] for i, result in enumerate(results) if result["last"] is not None)
+
+    # Ranges are in file order, so errors go out range by range
+    for offset, result, duplicate in zip(offsets, results, duplicates):
+        problems = [(offset + i, message) for i, message in result["problems"] if first <= offset + i <= last]
+        if result["regular"]:
+            hostnames = result["hostnames"].split("\n")
+            domain_table, domain_ids = result["domains"]
+            domains = list(map(domain_table.__getitem__, domain_ids))
+            ports = result["ports"].split("\n")
+            if any(duplicate):
+                regular = result["regular"]
+                for j in compress(range(len(duplicate)), duplicate):
+                    problems.append((offset + regular[j],
+                                     f"Duplicate hostname '{hostnames[j]}' and port '{ports[j]}'"))
+                keep = bytearray(map(not_, duplicate))
+                hostnames, domains, ports = (list(compress(column, keep)) for column in (hostnames, domains, ports))
+            host_port_list.extend_columns(hostnames, domains, ports)
+        problems.sort()
+        errors.extend(f"Line {index - first + 1}: {message}" for index, message in problems)
+
+    return host_port_list, errors